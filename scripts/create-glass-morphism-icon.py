@@ -7,6 +7,17 @@ Generate a glass morphism app icon for LexiconFlow programmatically.
 Creates:
 - app-icon.png (1024×1024, light mode)
 - app-icon-dark.png (1024×1024, dark mode)
+- app-icon-tinted.png (white on transparent, derived from light) and
+  AppIcon-Alternate.appiconset/app-icon-alternate.png (with --appearances)
+
+All geometry is relative to the canvas, so --size renders natively at any
+master size (256 for previews, 1024 for the App Store, 4096 for marketing).
+
+Usage:
+    python3 create-glass-morphism-icon.py
+    python3 create-glass-morphism-icon.py --size 256 --output /tmp/preview
+    python3 create-glass-morphism-icon.py --size 8192 --memory-budget 256 --output marketing/
+    python3 create-glass-morphism-icon.py --appearances light,dark,tinted,alternate --jobs 4
 
 Requirements:
     - Python 3.6+
@@ -14,8 +25,23 @@ Requirements:
     - NumPy (pip install numpy)
 """
 
+import argparse
+import functools
+import hashlib
+import importlib.util
+import json
+import struct
 import sys
 import os
+import time
+import zlib
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 try:
     from PIL import Image, ImageDraw, ImageFilter
@@ -26,7 +52,87 @@ except ImportError as e:
     sys.exit(1)
 
 
-def create_noise_texture(width, height, opacity=5):
+# Default noise seed; fixed so rebuilds produce identical bytes
+NOISE_SEED = 1024
+
+# Side of the random tile the noise texture is tiled from
+NOISE_TILE_SIZE = 256
+
+# On-disk cache for expanded noise textures
+NOISE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lexiconflow", "noise")
+
+
+def noise_tile(seed=NOISE_SEED, tile_size=NOISE_TILE_SIZE):
+    """
+    Generate a seeded, tileable grayscale noise tile.
+
+    White noise has no spatial correlation, so the tile wraps seamlessly.
+
+    Args:
+        seed: RNG seed
+        tile_size: Tile width and height
+
+    Returns:
+        uint8 array of shape (tile_size, tile_size)
+    """
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (tile_size, tile_size), dtype=np.uint8)
+
+
+def noise_array(width, height, opacity=5, seed=NOISE_SEED, cache_dir=NOISE_CACHE_DIR, rows=None):
+    """
+    Expand the noise tile to an RGBA texture, cached on disk.
+
+    Args:
+        width: Image width
+        height: Image height
+        opacity: Opacity percentage (1-100)
+        seed: RNG seed for the tile
+        cache_dir: Directory for cached textures (None disables the disk cache)
+        rows: Optional (first, last) row range to expand, for tiled
+            rendering; row ranges are never cached
+
+    Returns:
+        uint8 array of shape (height, width, 4) or (last - first, width, 4),
+        read-only when loaded from cache
+    """
+    first_row, last_row = rows if rows is not None else (0, height)
+    cache_path = None
+    if cache_dir and rows is None:
+        cache_path = os.path.join(
+            cache_dir,
+            f"noise-s{seed}-t{NOISE_TILE_SIZE}-{width}x{height}-o{opacity}.npy",
+        )
+        if os.path.exists(cache_path):
+            try:
+                return np.load(cache_path, mmap_mode='r')
+            except (OSError, ValueError):
+                pass  # Corrupt entry; regenerate below
+
+    tile = noise_tile(seed)
+    tile_size = tile.shape[0]
+    reps_x = -(-width // tile_size)
+
+    texture = np.empty((last_row - first_row, width, 4), dtype=np.uint8)
+    tile_rows = tile[np.arange(first_row, last_row) % tile_size]
+    gray = np.tile(tile_rows, (1, reps_x))[:, :width]
+    texture[..., :3] = gray[..., None]
+    texture[..., 3] = int(255 * opacity / 100)
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, texture)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not cache noise texture: {e}")
+
+    return texture
+
+
+def create_noise_texture(width, height, opacity=5, seed=NOISE_SEED, cache_dir=NOISE_CACHE_DIR):
     """
     Create a noise texture overlay.
 
@@ -34,22 +140,190 @@ def create_noise_texture(width, height, opacity=5):
         width: Image width
         height: Image height
         opacity: Opacity percentage (1-100)
+        seed: RNG seed; the same seed always produces the same texture
+        cache_dir: Directory for cached textures (None disables the disk cache)
 
     Returns:
         PIL Image with noise texture
     """
-    # Generate random noise
-    noise = np.random.randint(0, 256, (height, width), dtype=np.uint8)
+    return Image.fromarray(
+        np.ascontiguousarray(noise_array(width, height, opacity, seed, cache_dir)),
+        mode='RGBA'
+    )
 
-    # Convert to PIL Image
-    noise_img = Image.fromarray(noise, mode='L')
 
-    # Create RGBA version with opacity
-    noise_rgba = noise_img.convert('RGBA')
-    alpha = int(255 * opacity / 100)
-    noise_rgba.putalpha(alpha)
+def _normalize_stops(stops):
+    """
+    Normalize gradient stops to sorted (position, color) pairs.
+
+    Args:
+        stops: Sequence of RGB tuples (evenly spaced) or (position, RGB) pairs
+
+    Returns:
+        Tuple (positions, colors) as float64 arrays of shape (n,) and (n, 3)
+    """
+    stops = list(stops)
+    if len(stops) < 2:
+        raise ValueError("A gradient needs at least two color stops")
+
+    if all(len(stop) == 2 for stop in stops):
+        positions = [float(position) for position, _ in stops]
+        colors = [color for _, color in stops]
+    else:
+        positions = [i / (len(stops) - 1) for i in range(len(stops))]
+        colors = stops
+
+    order = np.argsort(positions, kind='stable')
+    positions = np.asarray(positions, dtype=np.float64)[order]
+    colors = np.asarray(colors, dtype=np.float64)[order][:, :3]
+    return positions, colors
+
+
+def _linear_direction(angle):
+    """
+    Unit-free direction vector for a linear gradient.
 
-    return noise_rgba
+    The vector is scaled so its largest component is 1 and snapped to whole
+    numbers where possible, so 0°/45°/90° gradients use exact integer math.
+
+    Args:
+        angle: Degrees clockwise from the +x axis (image coordinates, y down)
+
+    Returns:
+        Tuple (dx, dy)
+    """
+    radians = np.deg2rad(angle)
+    dx, dy = np.cos(radians), np.sin(radians)
+    scale = max(abs(dx), abs(dy))
+    dx, dy = dx / scale, dy / scale
+    dx = float(round(dx)) if abs(dx - round(dx)) < 1e-9 else float(dx)
+    dy = float(round(dy)) if abs(dy - round(dy)) < 1e-9 else float(dy)
+    return dx, dy
+
+
+def _interpolate_stops(pos, positions, colors):
+    """
+    Map gradient positions through color stops.
+
+    Args:
+        pos: float64 array of positions (0-1, clamped)
+        positions: Sorted stop positions, shape (n,)
+        colors: Stop colors, shape (n, 3)
+
+    Returns:
+        uint8 array of shape pos.shape + (3,)
+    """
+    # Segment i spans positions[i]..positions[i + 1]
+    segment = np.searchsorted(positions, pos, side='right') - 1
+    np.clip(segment, 0, len(positions) - 2, out=segment)
+    p0 = positions[segment]
+    span = positions[segment + 1] - p0
+    t = np.divide(pos - p0, span, out=np.zeros_like(pos), where=span > 0)
+    np.clip(t, 0.0, 1.0, out=t)
+    u = 1 - t
+
+    result = np.empty(pos.shape + (3,), dtype=np.uint8)
+    for channel in range(3):
+        c0 = colors[segment, channel]
+        c1 = colors[segment + 1, channel]
+        # Same blend and truncation as the original per-pixel loop
+        result[..., channel] = c0 * u + c1 * t
+    return result
+
+
+def gradient_array(size, stops, angle=45.0, mode='linear', center=(0.5, 0.5), rows=None):
+    """
+    Render a multi-stop gradient as a NumPy array.
+
+    Linear gradients only vary along one axis, so colors are computed once
+    per projected distance into a lookup table and gathered with a
+    broadcast index. Directions with integer components (0°, 45°, 90°...)
+    are exact; other angles quantize the projection to 1/16 px. Radial
+    gradients use the same lookup keyed by radius in 1/16 px steps.
+
+    Args:
+        size: Tuple (width, height)
+        stops: Sequence of RGB tuples (evenly spaced) or (position, RGB) pairs
+        angle: Direction for linear gradients, degrees clockwise from +x
+        mode: 'linear' or 'radial'
+        center: Radial center as fractions of (width, height)
+        rows: Optional (first, last) row range to render, for tiled rendering
+
+    Returns:
+        uint8 array of shape (height, width, 3), or (last - first, width, 3)
+    """
+    width, height = size
+    first_row, last_row = rows if rows is not None else (0, height)
+    positions, colors = _normalize_stops(stops)
+    gradient = np.empty((last_row - first_row, width, 3), dtype=np.uint8)
+    band_rows = max(1, (1 << 20) // max(width, 1))
+
+    xs = np.arange(width, dtype=np.float64)
+    ys = np.arange(height, dtype=np.float64)
+
+    if mode == 'linear':
+        dx, dy = _linear_direction(angle)
+        # Project onto the direction and normalize over the canvas extent
+        offset = (width * -dx if dx < 0 else 0.0) + (height * -dy if dy < 0 else 0.0)
+        extent = width * abs(dx) + height * abs(dy)
+        steps = 1 if dx.is_integer() and dy.is_integer() else 16
+
+        col_keys = np.rint(xs * dx * steps).astype(np.int64)
+        row_keys = np.rint((ys * dy + offset) * steps).astype(np.int64)
+        key_min = int(col_keys.min() + row_keys.min())
+        key_max = int(col_keys.max() + row_keys.max())
+        col_keys -= key_min
+
+        keys = np.arange(key_min, key_max + 1, dtype=np.float64)
+        lut = _interpolate_stops(keys / steps / extent, positions, colors)
+
+        for y0 in range(first_row, last_row, band_rows):
+            y1 = min(last_row, y0 + band_rows)
+            index = row_keys[y0:y1, None] + col_keys[None, :]
+            np.take(lut, index, axis=0, out=gradient[y0 - first_row:y1 - first_row])
+
+    elif mode == 'radial':
+        cx, cy = center[0] * width, center[1] * height
+        # Normalize by the farthest corner so the last stop lands on it
+        extent = max(
+            np.hypot(corner_x - cx, corner_y - cy)
+            for corner_x in (0, width)
+            for corner_y in (0, height)
+        )
+        steps = 16
+        col_term = ((xs - cx) * steps) ** 2
+        row_term = ((ys - cy) * steps) ** 2
+
+        keys = np.arange(int(np.ceil(extent * steps)) + 1, dtype=np.float64)
+        lut = _interpolate_stops(keys / steps / extent, positions, colors)
+
+        for y0 in range(first_row, last_row, band_rows):
+            y1 = min(last_row, y0 + band_rows)
+            radius = np.sqrt(row_term[y0:y1, None] + col_term[None, :])
+            index = np.rint(radius, out=radius).astype(np.intp)
+            np.take(lut, index, axis=0, out=gradient[y0 - first_row:y1 - first_row])
+
+    else:
+        raise ValueError(f"Unknown gradient mode: {mode!r} (expected 'linear' or 'radial')")
+
+    return gradient
+
+
+def create_gradient(size, stops, angle=45.0, mode='linear', center=(0.5, 0.5)):
+    """
+    Create a multi-stop gradient image.
+
+    Args:
+        size: Tuple (width, height)
+        stops: Sequence of RGB tuples (evenly spaced) or (position, RGB) pairs
+        angle: Direction for linear gradients, degrees clockwise from +x
+        mode: 'linear' or 'radial'
+        center: Radial center as fractions of (width, height)
+
+    Returns:
+        PIL Image with gradient
+    """
+    return Image.fromarray(gradient_array(size, stops, angle, mode, center), mode='RGB')
 
 
 def create_gradient_color(size, color_start, color_middle, color_end):
@@ -65,55 +339,42 @@ def create_gradient_color(size, color_start, color_middle, color_end):
     Returns:
         PIL Image with gradient
     """
-    width, height = size
-
-    # Create gradient array
-    gradient = np.zeros((height, width, 3), dtype=np.uint8)
+    return create_gradient(size, [color_start, color_middle, color_end], angle=45.0)
 
-    for y in range(height):
-        for x in range(width):
-            # Calculate position along diagonal (0 to 1)
-            pos = (x + y) / (width + height)
 
-            # Interpolate between colors
-            if pos < 0.5:
-                # Start to middle
-                t = pos * 2
-                r = int(color_start[0] * (1 - t) + color_middle[0] * t)
-                g = int(color_start[1] * (1 - t) + color_middle[1] * t)
-                b = int(color_start[2] * (1 - t) + color_middle[2] * t)
-            else:
-                # Middle to end
-                t = (pos - 0.5) * 2
-                r = int(color_middle[0] * (1 - t) + color_end[0] * t)
-                g = int(color_middle[1] * (1 - t) + color_end[1] * t)
-                b = int(color_middle[2] * (1 - t) + color_end[2] * t)
+# Icon geometry as fractions of the canvas, designed on a 1024 px canvas
+L_STROKE_THICK = 120 / 1024  # Thickest point of the 'L'
+L_STROKE_THIN = 60 / 1024    # Thinnest point of the 'L'
+L_TAPER_DROP = 50 / 1024     # Length of the tapered top of the vertical stroke
+L_CORNER_CUT = 20 / 1024     # Bevel at the bottom corner
+GLASS_BLUR_RADIUS = 40 / 1024
+GLASS_BORDER_WIDTH = 2 / 1024
 
-            gradient[y, x] = [r, g, b]
 
-    return Image.fromarray(gradient, mode='RGB')
+def _px(fraction, side):
+    """Canvas-relative length in whole pixels (at least 1)."""
+    return max(1, int(round(fraction * side)))
 
 
-def create_fluid_L(size, gradient_img):
+def _fluid_L_points(size):
     """
-    Create a calligraphic fluid 'L' symbol.
+    Polygon outline of the calligraphic fluid 'L'.
 
     Args:
         size: Tuple (width, height)
-        gradient_img: Gradient image to use as fill
 
     Returns:
-        PIL Image with fluid 'L' symbol (RGBA, transparent background)
+        List of (x, y) points
     """
     width, height = size
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
     # L dimensions
     l_height = int(height * 0.5)  # ~500px for 1024px canvas
     l_width = int(l_height * 0.7)  # ~350px
-    stroke_thick = 120  # Thickest point
-    stroke_thin = 60    # Thinnest point
+    stroke_thick = _px(L_STROKE_THICK, height)  # Thickest point
+    stroke_thin = _px(L_STROKE_THIN, height)    # Thinnest point
+    taper_drop = _px(L_TAPER_DROP, height)
+    corner_cut = _px(L_CORNER_CUT, height)
 
     # Center position
     center_x = width // 2
@@ -131,14 +392,14 @@ def create_fluid_L(size, gradient_img):
     points = [
         # Left side of vertical stroke (tapered at top)
         (left + stroke_thick // 3, top),  # Top-left
-        (left + stroke_thick // 2, top + 50),  # Below top
+        (left + stroke_thick // 2, top + taper_drop),  # Below top
 
         # Vertical stroke right side
         (left + stroke_thick, top + l_height * 0.1),  # Start of thick section
-        (left + stroke_thick, bottom - 20),  # Bottom-right before corner
+        (left + stroke_thick, bottom - corner_cut),  # Bottom-right before corner
 
         # Corner to horizontal stroke
-        (left + stroke_thin + 20, bottom),  # Bottom-right of corner
+        (left + stroke_thin + corner_cut, bottom),  # Bottom-right of corner
         (left + stroke_thin, bottom),  # Bottom-left of corner
 
         # Horizontal stroke left side
@@ -149,168 +410,1498 @@ def create_fluid_L(size, gradient_img):
         (left + l_width * 0.7, crossbar_y),  # Top of crossbar
 
         # Return to top
-        (left + stroke_thick // 2, top + 50),  # Back to vertical
+        (left + stroke_thick // 2, top + taper_drop),  # Back to vertical
         (left + stroke_thick // 3, top),  # Close at top
     ]
 
-    # Draw 'L' with gradient
-    # Create a temporary image for the 'L' shape
-    l_mask = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    l_draw = ImageDraw.Draw(l_mask)
-    l_draw.polygon(points, fill=(255, 255, 255, 255))
+    return points
 
-    # Composite gradient onto 'L' shape
-    l_final = Image.alpha_composite(
-        Image.new('RGBA', (width, height), (0, 0, 0, 0)),
-        gradient_img.convert('RGBA')
-    )
-    l_final = Image.composite(l_final, Image.new('RGBA', (width, height)), l_mask.split()[-1])
 
-    return l_final
+def fluid_L_patch(size, gradient, rows=None):
+    """
+    Rasterize the fluid 'L' within its bounding box only.
 
+    The polygon is drawn into a mask the size of its bounding box, and the
+    gradient pixels under it are copied straight into an RGBA patch, so the
+    cost is O(glyph area) rather than O(canvas).
 
-def create_glass_card(size, blur_radius=40, opacity=25, border_opacity=40):
+    Args:
+        size: Tuple (width, height)
+        gradient: Full-canvas gradient fill, as a PIL Image or (height, width, 3)
+            array; with rows, an array holding just those rows
+        rows: Optional (first, last) row range to rasterize, for tiled rendering
+
+    Returns:
+        Tuple (RGBA uint8 patch array, (left, top) position on the canvas);
+        the patch is empty when rows miss the glyph
+    """
+    width, height = size
+    points = _fluid_L_points(size)
+    first_row = rows[0] if rows is not None else 0
+
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    left = max(0, int(np.floor(min(xs))))
+    top = max(0, int(np.floor(min(ys))))
+    right = min(width, int(np.ceil(max(xs))) + 1)
+    bottom = min(height, int(np.ceil(max(ys))) + 1)
+    if rows is not None:
+        top, bottom = max(top, rows[0]), min(bottom, rows[1])
+        if top >= bottom:
+            return np.zeros((0, right - left, 4), dtype=np.uint8), (left, rows[0])
+
+    # Integer offsets keep the rasterization identical to a full-canvas draw
+    mask_img = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask_img).polygon([(x - left, y - top) for x, y in points], fill=255)
+    mask = np.asarray(mask_img) > 0
+
+    if isinstance(gradient, np.ndarray):
+        fill = gradient[top - first_row:bottom - first_row, left:right, :3]
+    else:
+        fill = np.asarray(gradient.crop((left, top, right, bottom)).convert('RGB'))
+
+    patch = np.zeros((bottom - top, right - left, 4), dtype=np.uint8)
+    patch[..., :3][mask] = fill[mask]
+    patch[..., 3][mask] = 255
+    return patch, (left, top)
+
+
+def create_fluid_L(size, gradient_img):
+    """
+    Create a calligraphic fluid 'L' symbol.
+
+    Args:
+        size: Tuple (width, height)
+        gradient_img: Gradient to use as fill (PIL Image or (height, width, 3) array)
+
+    Returns:
+        PIL Image with fluid 'L' symbol (RGBA, transparent background)
+    """
+    patch, position = fluid_L_patch(size, gradient_img)
+    img = Image.new('RGBA', size, (0, 0, 0, 0))
+    img.paste(Image.fromarray(patch, mode='RGBA'), position)
+    return img
+
+
+# Smallest blur radius left after downsampling in the blur pyramid
+PYRAMID_MIN_RADIUS = 2.0
+
+
+def _blur_support(radius):
+    """
+    Pixels beyond which a Pillow GaussianBlur has no effect.
+
+    GaussianBlur runs three box blurs whose combined reach is about 3× the
+    radius; two extra pixels cover rounding of the box sizes.
+    """
+    return int(np.ceil(3 * radius)) + 2
+
+
+def _premultiplied(rgba):
+    """RGBA array with color premultiplied by alpha, as float32."""
+    rgba = np.asarray(rgba, dtype=np.float32)
+    result = rgba.copy()
+    result[..., :3] *= rgba[..., 3:] / 255
+    return result
+
+
+def _pyramid_blur(image, radius, factor):
+    """
+    Approximate GaussianBlur by downsample → blur → upsample.
+
+    Args:
+        image: RGBA image
+        radius: Blur radius at full resolution
+        factor: Integer downsample factor
+
+    Returns:
+        Blurred RGBA image, same size as image
+    """
+    small = image.reduce(factor).filter(ImageFilter.GaussianBlur(radius=radius / factor))
+    # Upsample by exactly `factor` so any sub-tile lines up with the full image.
+    # Resize per band: resizing RGBA premultiplies alpha, which would shift the
+    # color of near-transparent pixels away from the exact blur
+    upsampled = (small.width * factor, small.height * factor)
+    bands = [
+        band.resize(upsampled, Image.Resampling.BILINEAR).crop((0, 0) + image.size)
+        for band in small.split()
+    ]
+    return Image.merge('RGBA', bands)
+
+
+def _blur_probes(crop, content, radius):
+    """
+    Pick the areas where a pyramid blur deviates most from the exact blur.
+
+    Errors concentrate where the content has sharp edges: the middle of each
+    side (straight edges, each at a different phase of the downsampling
+    grid) and the first opaque pixel along the top-left diagonal (corner
+    curvature).
+
+    Args:
+        crop: RGBA image being blurred
+        content: (left, top, right, bottom) of the content within crop
+        radius: Gaussian blur radius
+
+    Returns:
+        List of ((left, top, right, bottom), axis) probes within crop, where
+        axis is 'x' or 'y' for probes on a straight edge running along that
+        axis and None for the corner
+    """
+    left, top, right, bottom = content
+    alpha = np.asarray(crop.getchannel('A'))
+    span = np.arange(min(right - left, bottom - top))
+    diagonal = alpha[top + span, left + span]
+    head = int(np.argmax(diagonal > 0)) if diagonal.any() else 0
+
+    mid_x, mid_y = (left + right) // 2, (top + bottom) // 2
+    # Errors peak within about one radius of an edge
+    half = max(1, int(np.ceil(radius)))
+    along = 16
+    probes = [
+        (mid_x, top, along, half, 'x'),
+        (mid_x, bottom, along, half, 'x'),
+        (left, mid_y, half, along, 'y'),
+        (right, mid_y, half, along, 'y'),
+        (left + head, top + head, half, half, None),
+    ]
+    return [
+        (
+            (
+                max(0, cx - hx),
+                max(0, cy - hy),
+                min(crop.width, cx + hx),
+                min(crop.height, cy + hy),
+            ),
+            axis,
+        )
+        for cx, cy, hx, hy, axis in probes
+    ]
+
+
+# The probes can miss the true peak error by up to ~1.4× (measured on card
+# layers from 128 to 4096 px), so probe errors must stay this far inside the
+# tolerance
+PYRAMID_PROBE_MARGIN = 1.5
+
+# Pyramid factors already chosen, keyed by (radius, tolerance, probe tiles)
+_PYRAMID_FACTORS = {}
+
+
+def _pyramid_factor(crop, content, radius, tolerance):
+    """
+    Coarsest pyramid factor whose error on the probes stays within tolerance.
+
+    The exact and pyramid blurs are evaluated only on small tiles around
+    each probe, so choosing a factor costs a fraction of a full blur. Edge
+    probes need no margin along the edge: the content is constant in that
+    direction, so the blur's edge clamping reproduces the full-image result.
+    Probe errors are held to tolerance / PYRAMID_PROBE_MARGIN, and the choice
+    is cached by the probe tiles' pixels, so appearances that draw the same
+    card (dark and tinted) search once per process.
+
+    Returns:
+        Power-of-two factor, or 1 if no pyramid level is accurate enough
+    """
+    support = _blur_support(radius)
+    max_factor = 1
+    while radius / (max_factor * 2) >= PYRAMID_MIN_RADIUS and max_factor * 2 <= min(crop.size) // 4:
+        max_factor *= 2
+    if max_factor == 1:
+        return 1
+
+    def align_down(value):
+        return value // max_factor * max_factor
+
+    def align_up(value):
+        return -(-value // max_factor) * max_factor
+
+    tiles = []
+    key = hashlib.sha256(repr((radius, tolerance, max_factor)).encode())
+    margin = support + 2 * max_factor
+    for (x0, y0, x1, y1), axis in _blur_probes(crop, content, radius):
+        # Align tiles to the coarsest grid so every level reduces identically
+        margin_x = 0 if axis == 'x' else margin
+        margin_y = 0 if axis == 'y' else margin
+        tile = (
+            max(0, align_down(x0 - margin_x)),
+            max(0, align_down(y0 - margin_y)),
+            min(crop.width, align_up(x1 + margin_x)),
+            min(crop.height, align_up(y1 + margin_y)),
+        )
+        valid = (x0 - tile[0], y0 - tile[1], x1 - tile[0], y1 - tile[1])
+        image = crop.crop(tile)
+        key.update(repr((image.size, valid)).encode())
+        key.update(image.tobytes())
+        tiles.append((image, valid))
+
+    key = key.hexdigest()
+    if key in _PYRAMID_FACTORS:
+        return _PYRAMID_FACTORS[key]
+
+    tiles = [
+        (image, valid, _premultiplied(image.filter(ImageFilter.GaussianBlur(radius=radius)).crop(valid)))
+        for image, valid in tiles
+    ]
+    probe_tolerance = tolerance / PYRAMID_PROBE_MARGIN
+    factor = max_factor
+    while factor > 1:
+        if all(
+            np.abs(_premultiplied(_pyramid_blur(image, radius, factor).crop(valid)) - exact).max() <= probe_tolerance
+            for image, valid, exact in tiles
+        ):
+            break
+        factor //= 2
+
+    _PYRAMID_FACTORS[key] = factor
+    return factor
+
+
+def blur_region(layer, box, radius, tolerance=0):
+    """
+    Gaussian-blur a layer that is fully transparent outside box.
+
+    Only box plus the blur's reach is processed, which is exact. That saves
+    work only for content that is small next to its blur: the app icon's
+    card spans 80% of the canvas and the reach is about 12% of it per side,
+    so there the region is the whole canvas and the bound saves nothing.
+
+    With tolerance > 0, large radii use a downsample/blur/upsample pyramid
+    at the coarsest factor whose error against the exact blur stays within
+    tolerance on probe tiles at the content's sharpest features (see
+    _pyramid_factor). The tolerance is therefore checked on samples, with a
+    safety margin, not proven for every pixel, and the probes assume
+    card-like content: straight edges with rounded corners.
+
+    Args:
+        layer: RGBA image, transparent outside box
+        box: (left, top, right, bottom) of the non-transparent content
+        radius: Gaussian blur radius
+        tolerance: Max per-pixel error (0-255, premultiplied RGBA) allowed
+            against the exact blur; 0 always blurs exactly
+
+    Returns:
+        Tuple (blurred RGBA image of the same size, pyramid factor used)
+    """
+    width, height = layer.size
+    support = _blur_support(radius)
+    left, top, right, bottom = box
+    region = (
+        max(0, left - support),
+        max(0, top - support),
+        min(width, right + support),
+        min(height, bottom + support),
+    )
+    crop = layer.crop(region)
+    content = (left - region[0], top - region[1], right - region[0], bottom - region[1])
+
+    factor = _pyramid_factor(crop, content, radius, tolerance) if tolerance > 0 else 1
+    if factor > 1:
+        blurred = _pyramid_blur(crop, radius, factor)
+    else:
+        blurred = crop.filter(ImageFilter.GaussianBlur(radius=radius))
+
+    result = Image.new('RGBA', layer.size, (0, 0, 0, 0))
+    result.paste(blurred, region[:2])
+    return result, factor
+
+
+def create_glass_card(
+    size,
+    blur_radius=None,
+    opacity=25,
+    border_opacity=40,
+    blur_tolerance=0,
+    rows=None,
+):
     """
     Create a frosted glass card effect.
 
     Args:
         size: Tuple (width, height)
-        blur_radius: Gaussian blur radius
+        blur_radius: Gaussian blur radius (default: 40 px at 1024, scaled to the canvas)
         opacity: Fill opacity percentage (0-100)
         border_opacity: Border opacity percentage (0-100)
+        blur_tolerance: Max per-pixel error allowed for the pyramid blur
+            (0 = exact; see blur_region)
+        rows: Optional (first, last) row range to render, for tiled
+            rendering. The card is drawn with a halo of the blur's reach
+            above and below, so the band matches the full render exactly;
+            blur_tolerance is ignored.
 
     Returns:
-        PIL Image with glass card effect
+        PIL Image with glass card effect (only the requested rows, if given)
     """
     width, height = size
+    side = min(width, height)
+    if blur_radius is None:
+        blur_radius = GLASS_BLUR_RADIUS * side
 
     # Card dimensions
-    card_size = int(min(width, height) * 0.80)  # 80% of canvas
+    card_size = int(side * 0.80)  # 80% of canvas
     corner_radius = int(card_size * 0.225)  # 22.5% of card width
 
-    # Create card image
-    card = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(card)
-
     # Card position (centered)
     card_left = (width - card_size) // 2
     card_top = (height - card_size) // 2
     card_right = card_left + card_size
     card_bottom = card_top + card_size
 
-    # Draw rounded rectangle
     alpha = int(255 * opacity / 100)
-    draw.rounded_rectangle(
-        [(card_left, card_top), (card_right, card_bottom)],
+    card_style = dict(
         radius=corner_radius,
         fill=(255, 255, 255, alpha),
         outline=(255, 255, 255, int(255 * border_opacity / 100)),
-        width=2
+        width=_px(GLASS_BORDER_WIDTH, side)
     )
 
-    # Apply blur
-    card_blurred = card.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+    if rows is None:
+        # Create card image
+        card = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(card)
+
+        # Draw rounded rectangle
+        draw.rounded_rectangle([(card_left, card_top), (card_right, card_bottom)], **card_style)
+
+        # Apply blur (only the card's bounding box carries content)
+        card_blurred, _ = blur_region(
+            card,
+            (card_left, card_top, card_right + 1, card_bottom + 1),
+            blur_radius,
+            tolerance=blur_tolerance
+        )
+        return card_blurred
+
+    # Tiled: draw the card's columns for the band plus a halo of the blur's
+    # reach above and below, blur that window and keep the band's rows
+    first_row, last_row = rows
+    support = _blur_support(blur_radius)
+    band = Image.new('RGBA', (width, last_row - first_row), (0, 0, 0, 0))
+
+    window_top = max(0, first_row - support)
+    window_bottom = min(height, last_row + support)
+    if window_bottom <= card_top or window_top > card_bottom:
+        return band  # Nothing within the blur's reach
+
+    uniform = window_top > card_top + corner_radius + 1 and window_bottom < card_bottom - corner_radius - 1
+    if uniform:
+        # Between the corners every row is identical, so blurring a single
+        # row (edges clamp vertically) gives each row of the band
+        window_top, window_bottom = first_row, first_row + 1
+
+    # The card is white wherever it is drawn, so its colour and alpha are
+    # blurred as two single-channel windows (identical to the RGBA blur, at
+    # half the memory)
+    window_left = max(0, card_left - support)
+    window_right = min(width, card_right + 1 + support)
+    window_size = (window_right - window_left, window_bottom - window_top)
+    box = [
+        (card_left - window_left, card_top - window_top),
+        (card_right - window_left, card_bottom - window_top),
+    ]
+    channels = []
+    for fill, outline in ((255, 255), (alpha, card_style['outline'][3])):
+        window = Image.new('L', window_size, 0)
+        ImageDraw.Draw(window).rounded_rectangle(
+            box, radius=corner_radius, fill=fill, outline=outline, width=card_style['width']
+        )
+        window = window.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+        if uniform:
+            window = window.resize((window.width, last_row - first_row), Image.Resampling.NEAREST)
+        else:
+            window = window.crop((0, first_row - window_top, window.width, last_row - window_top))
+        channels.append(window)
+        del window
+
+    white, card_alpha = channels
+    rows_img = Image.merge('RGBA', (white, white, white, card_alpha))
+    band.paste(rows_img, (window_left, 0))
+    return band
+
+
+# Per-appearance styling; everything else is shared between appearances
+APPEARANCES = {
+    "light": {
+        "background": (255, 255, 255),
+        "glass_opacity": 25,
+        "border_opacity": 40,
+        "filename": "app-icon.png",
+    },
+    "dark": {
+        "background": (0, 0, 0),
+        "glass_opacity": 30,
+        "border_opacity": 50,
+        "filename": "app-icon-dark.png",
+    },
+    # iOS tints a white-on-transparent icon, so tinted isn't rendered but
+    # derived from the light icon (derive_tinted_master in
+    # generate-icon-variants.py, which --variants-output uses too)
+    "tinted": {
+        "derived_from": "light",
+        "filename": "app-icon-tinted.png",
+    },
+    # Alternate icons live in their own icon set (see alternate_icon_set)
+    "alternate": {
+        "background": (30, 27, 75),  # #1E1B4B Indigo 950
+        "glass_opacity": 20,
+        "border_opacity": 35,
+        "filename": "app-icon-alternate.png",
+        "own_icon_set": True,
+    },
+}
+
+# Gradient stops for the 'L' symbol
+L_GRADIENT_COLORS = (
+    (99, 102, 241),   # #6366F1 Indigo 500
+    (236, 72, 153),   # #EC4899 Pink 500
+    (139, 92, 246),   # #8B5CF6 Violet 500
+)
+
+
+class LayerCache:
+    """
+    LRU cache of rendered layers shared across icon modes.
+
+    Layers are keyed by (layer function, parameters), where the canvas size
+    is one of the parameters, so mode-independent layers such as the
+    gradient, the fluid 'L' and the noise texture are rendered once per run.
+    Cached layers are shared: callers must treat them as read-only.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Memory bound for cached layers; least recently used
+                layers are evicted once it is exceeded
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def _key(func, args, kwargs):
+        return (func, args, tuple(sorted(kwargs.items())))
+
+    @staticmethod
+    def _layer_bytes(layer):
+        """Approximate memory footprint of a PIL Image, NumPy array or placed patch."""
+        if isinstance(layer, tuple):
+            layer = layer[0]
+        if isinstance(layer, np.ndarray):
+            return layer.nbytes
+        return layer.width * layer.height * len(layer.getbands())
+
+    def get(self, func, *args, **kwargs):
+        """
+        Return func(*args, **kwargs), rendering it only on a cache miss.
+
+        Args:
+            func: Layer function
+            *args, **kwargs: Hashable layer parameters (including size)
+
+        Returns:
+            The cached or freshly rendered layer
+        """
+        key = self._key(func, args, kwargs)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+        self.misses += 1
+        layer = func(*args, **kwargs)
+        self._store(key, layer)
+        return layer
+
+    def put(self, layer, func, *args, **kwargs):
+        """
+        Seed the cache with a layer rendered elsewhere (e.g. by a parent process).
+
+        Args:
+            layer: Rendered layer
+            func: Layer function that would have produced it
+            *args, **kwargs: Layer parameters, as passed to get()
+        """
+        self._store(self._key(func, args, kwargs), layer)
+
+    def _store(self, key, layer):
+        nbytes = self._layer_bytes(layer)
+        if nbytes > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (layer, nbytes)
+        self.current_bytes += nbytes
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_bytes
+
+    def clear(self):
+        """Drop all cached layers and reset statistics."""
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def summary(self):
+        """One-line hit/miss and memory summary."""
+        return (
+            f"{self.hits} hits, {self.misses} misses, "
+            f"{self.current_bytes / (1024 * 1024):.1f} MB cached"
+        )
+
+
+# Shared by every create_app_icon call in this process
+LAYER_CACHE = LayerCache()
+
+
+def create_gradient_L(size, colors=L_GRADIENT_COLORS, cache=LAYER_CACHE):
+    """
+    Create the fluid 'L' symbol filled with a three-stop gradient.
 
-    return card_blurred
+    Args:
+        size: Tuple (width, height)
+        colors: (start, middle, end) RGB tuples
+        cache: LayerCache to fetch the gradient array from
+
+    Returns:
+        Tuple (RGBA patch array, (left, top)), as returned by fluid_L_patch
+    """
+    gradient = cache.get(gradient_array, size, colors)
+    return fluid_L_patch(size, gradient)
 
 
-def create_app_icon(mode='light', output_path='app-icon.png'):
+def composite_layers(size, background, layers):
+    """
+    Blend RGBA layers over an opaque background.
+
+    Same bytes as chaining Image.alpha_composite over the background and
+    flattening to RGB: over an opaque destination, alpha compositing is a
+    masked paste, which Pillow blends in place. So the only full-canvas
+    buffer is the RGB result, and each layer is pasted from its
+    non-transparent bounding box (Image.getbbox) only.
+
+    Args:
+        size: Tuple (width, height)
+        background: RGB tuple for the opaque background
+        layers: Back to front; each a full-canvas RGBA PIL Image or
+            (height, width, 4) uint8 array, or a placed patch
+            (image or array, (left, top)) as returned by fluid_L_patch;
+            patches may hang over the canvas edges
+
+    Returns:
+        PIL Image (RGB)
+    """
+    width, height = size
+    result = Image.new('RGB', size, tuple(background))
+    for layer in layers:
+        offset_x, offset_y = 0, 0
+        if isinstance(layer, tuple):
+            layer, (offset_x, offset_y) = layer
+        if not isinstance(layer, Image.Image):
+            layer = Image.fromarray(layer)  # Shares the array's memory
+        bbox = layer.getbbox()
+        if bbox is None:
+            continue
+
+        # Clip the layer's content to the canvas
+        box = (
+            max(bbox[0], -offset_x),
+            max(bbox[1], -offset_y),
+            min(bbox[2], width - offset_x),
+            min(bbox[3], height - offset_y),
+        )
+        if box[0] >= box[2] or box[1] >= box[3]:
+            continue
+        if box != (0, 0) + layer.size:
+            layer = layer.crop(box)
+        result.paste(layer, (box[0] + offset_x, box[1] + offset_y), mask=layer)
+
+    return result
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB (0 if unavailable)."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def create_app_icon(
+    mode='light',
+    output_path='app-icon.png',
+    size=(1024, 1024),
+    cache=LAYER_CACHE,
+    blur_tolerance=0,
+    noise_seed=NOISE_SEED,
+    noise_cache_dir=NOISE_CACHE_DIR,
+):
     """
     Create a complete glass morphism app icon.
 
     Args:
-        mode: 'light' or 'dark'
-        output_path: Where to save the icon
+        mode: Appearance name from APPEARANCES ('light', 'dark', 'tinted', 'alternate')
+        output_path: Where to save the icon (None keeps it in memory only,
+            e.g. to hand it to generate_variants)
+        size: Canvas size (width, height); geometry scales with it
+        cache: LayerCache for layers shared between modes
+        blur_tolerance: Max per-pixel glass blur error (0 = exact blur)
+        noise_seed: Seed for the noise texture
+        noise_cache_dir: Disk cache for noise textures (None disables it)
 
     Returns:
-        PIL Image of the complete icon
+        PIL Image of the complete icon (RGB; RGBA for tinted)
     """
     print(f"🎨 Creating {mode} mode app icon...")
 
-    # Canvas size
-    size = (1024, 1024)
+    appearance = APPEARANCES[mode]
+    size = tuple(size)
+
+    if "derived_from" in appearance:
+        base = create_app_icon(
+            appearance["derived_from"], None, size, cache, blur_tolerance, noise_seed, noise_cache_dir
+        )
+        print(f"  🩶 Deriving {mode} from the {appearance['derived_from']} icon")
+        icon = load_variants_module().derive_tinted_master(base)
+        if output_path:
+            icon.save(output_path, 'PNG')
+            print(f"  ✓ Saved to {output_path}")
+        return icon
 
     # Background color
-    bg_color = (255, 255, 255) if mode == 'light' else (0, 0, 0)
+    bg_color = appearance["background"]
 
     # Glass card opacity
-    glass_opacity = 25 if mode == 'light' else 30
-    border_opacity = 40 if mode == 'light' else 50
-
-    # Create background layer
-    background = Image.new('RGB', size, bg_color)
-    background_rgba = background.convert('RGBA')
+    glass_opacity = appearance["glass_opacity"]
+    border_opacity = appearance["border_opacity"]
 
     # Create glass card layer
-    glass_card = create_glass_card(
+    glass_card = cache.get(
+        create_glass_card,
         size,
-        blur_radius=40,
         opacity=glass_opacity,
-        border_opacity=border_opacity
+        border_opacity=border_opacity,
+        blur_tolerance=blur_tolerance
     )
 
-    # Create gradient for 'L' symbol
-    gradient = create_gradient_color(
-        size,
-        color_start=(99, 102, 241),   # #6366F1 Indigo 500
-        color_middle=(236, 72, 153),  # #EC4899 Pink 500
-        color_end=(139, 92, 246)      # #8B5CF6 Violet 500
+    # Create fluid 'L' symbol with gradient fill
+    fluid_l = cache.get(create_gradient_L, size, L_GRADIENT_COLORS, cache)
+
+    # Create noise texture
+    noise = cache.get(
+        create_noise_texture,
+        size[0],
+        size[1],
+        opacity=5,
+        seed=noise_seed,
+        cache_dir=noise_cache_dir
     )
 
-    # Create fluid 'L' symbol
-    fluid_l = create_fluid_L(size, gradient)
+    # Composite all layers (back to front) over the background, straight to RGB
+    icon_rgb = composite_layers(size, bg_color, [glass_card, fluid_l, noise])
 
-    # Create noise texture
-    noise = create_noise_texture(size[0], size[1], opacity=5)
+    # Save
+    if output_path:
+        icon_rgb.save(output_path, 'PNG', quality=95)
+        print(f"  ✓ Saved to {output_path}")
 
-    # Composite all layers (back to front)
-    # 1. Background
-    icon = background_rgba.copy()
+    return icon_rgb
 
-    # 2. Glass card
-    icon = Image.alpha_composite(icon, glass_card)
 
-    # 3. Fluid 'L' symbol
-    icon = Image.alpha_composite(icon, fluid_l)
+class StreamingPNGWriter:
+    """
+    Write an 8-bit RGB PNG incrementally, one band of rows at a time.
 
-    # 4. Noise overlay
-    icon = Image.alpha_composite(icon, noise)
+    Rows are Paeth-filtered with NumPy and fed through a single zlib stream,
+    so only the current band is ever held in memory. The file is written to
+    a temporary path and renamed into place on close.
+    """
 
-    # Convert to RGB (remove alpha for App Store)
-    icon_rgb = Image.new('RGB', size, bg_color)
-    icon_rgb.paste(icon, mask=icon.split()[-1])
+    IDAT_CHUNK_BYTES = 1 << 20
+
+    def __init__(self, path, width, height, compress_level=6):
+        """
+        Args:
+            path: Output PNG path
+            width: Image width
+            height: Image height
+            compress_level: zlib level (0-9)
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self._channels = 3
+        self._tmp_path = f"{path}.{os.getpid()}.tmp"
+        self._file = open(self._tmp_path, "wb")
+        self._compressor = zlib.compressobj(compress_level)
+        self._pending = bytearray()
+        self._previous_row = np.zeros(width * self._channels, dtype=np.uint8)
+
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        # Bit depth 8, color type 2 (RGB), default compression/filter/interlace
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+    def _write_chunk(self, chunk_type, data):
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type)) & 0xFFFFFFFF))
+
+    def _flush_idat(self, final=False):
+        while len(self._pending) >= self.IDAT_CHUNK_BYTES or (final and self._pending):
+            data = bytes(self._pending[:self.IDAT_CHUNK_BYTES])
+            del self._pending[:self.IDAT_CHUNK_BYTES]
+            self._write_chunk(b"IDAT", data)
+
+    def _paeth_filter(self, rows):
+        """Apply PNG filter type 4 (Paeth) to a (n, width * channels) uint8 block."""
+        channels = self._channels
+        x = rows.astype(np.int16)
+        b = np.empty_like(x)
+        b[0] = self._previous_row
+        b[1:] = x[:-1]
+        a = np.zeros_like(x)
+        a[:, channels:] = x[:, :-channels]
+        c = np.zeros_like(x)
+        c[:, channels:] = b[:, :-channels]
+
+        p = a + b - c
+        pa, pb, pc = np.abs(p - a), np.abs(p - b), np.abs(p - c)
+        predictor = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+        filtered = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+        filtered[:, 0] = 4
+        filtered[:, 1:] = (x - predictor) & 0xFF
+        return filtered
+
+    def write(self, rows, block_rows=64):
+        """
+        Append a band of rows.
+
+        Args:
+            rows: (n, width, 3) uint8 array
+            block_rows: Rows filtered per step, bounding the int16 temporaries
+        """
+        rows = np.asarray(rows, dtype=np.uint8).reshape(len(rows), -1)
+        if self.rows_written + len(rows) > self.height:
+            raise ValueError(f"Too many rows for a {self.width}×{self.height} PNG")
+
+        for start in range(0, len(rows), block_rows):
+            block = rows[start:start + block_rows]
+            self._pending += self._compressor.compress(self._paeth_filter(block).tobytes())
+            self._previous_row = block[-1].copy()
+            self._flush_idat()
+        self.rows_written += len(rows)
+
+    def close(self):
+        """Finish the zlib stream and move the PNG into place."""
+        if self.rows_written != self.height:
+            raise ValueError(f"Wrote {self.rows_written} of {self.height} rows")
+        self._pending += self._compressor.flush()
+        self._flush_idat(final=True)
+        self._write_chunk(b"IEND", b"")
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Discard the partially written file."""
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+# Working-set estimate for tiled rendering: bytes per canvas pixel of a band
+# (layers, compositor buffers, PNG filter temporaries, the band's share of
+# the blur window) and per halo pixel (the glass card drawn and blurred above
+# and below the band, including the blur's margin beside the card)
+TILE_BYTES_PER_PIXEL = 32
+TILE_HALO_BYTES_PER_PIXEL = 6
+TILE_BASELINE_MB = 48  # Interpreter, NumPy and Pillow
+
+
+def _tile_rows(width, halo, memory_budget_mb):
+    """
+    Tallest band whose working set fits the memory budget.
+
+    Raises:
+        ValueError: If even an 8-row band does not fit
+    """
+    available = (memory_budget_mb - TILE_BASELINE_MB) * 1024 * 1024
+    available -= TILE_HALO_BYTES_PER_PIXEL * 2 * halo * width
+    band_rows = int(available // (TILE_BYTES_PER_PIXEL * width))
+    if band_rows < 8:
+        needed = TILE_BASELINE_MB + (
+            TILE_HALO_BYTES_PER_PIXEL * 2 * halo * width + TILE_BYTES_PER_PIXEL * 8 * width
+        ) / (1024 * 1024)
+        raise ValueError(
+            f"Memory budget of {memory_budget_mb} MB is too small for a {width} px wide "
+            f"icon; need at least {int(np.ceil(needed))} MB"
+        )
+    return band_rows
+
+
+def render_app_icon_tiled(
+    mode='light',
+    output_path='app-icon.png',
+    size=(1024, 1024),
+    memory_budget_mb=256,
+    noise_seed=NOISE_SEED,
+):
+    """
+    Render an app icon in horizontal bands with bounded memory.
+
+    Every layer is evaluated only for the current band (the glass card with
+    a halo of the blur's reach), composited, and streamed into the PNG, so
+    the working set depends on the budget, not the output size. The result
+    matches create_app_icon with an exact blur.
+
+    Args:
+        mode: Appearance name from APPEARANCES
+        output_path: Where to save the icon
+        size: Canvas size (width, height)
+        memory_budget_mb: Target peak RSS in MB
+        noise_seed: Seed for the noise texture
+
+    Returns:
+        Number of bands rendered
+
+    Raises:
+        ValueError: For derived appearances (tinted), which need the whole
+            base icon at once
+    """
+    appearance = APPEARANCES[mode]
+    if "derived_from" in appearance:
+        raise ValueError(f"{mode} is derived from the whole {appearance['derived_from']} icon and can't be rendered in bands")
+    width, height = size
+    bg_color = appearance["background"]
+    halo = _blur_support(GLASS_BLUR_RADIUS * min(width, height))
+    band_rows = min(height, _tile_rows(width, halo, memory_budget_mb))
+    bands = -(-height // band_rows)
+
+    print(f"🎨 Creating {mode} mode app icon in {bands} bands of {band_rows} rows...")
+
+    with StreamingPNGWriter(output_path, width, height) as png:
+        for first_row in range(0, height, band_rows):
+            rows = (first_row, min(height, first_row + band_rows))
+
+            glass_card = create_glass_card(
+                size,
+                opacity=appearance["glass_opacity"],
+                border_opacity=appearance["border_opacity"],
+                rows=rows
+            )
+            gradient = gradient_array(size, L_GRADIENT_COLORS, rows=rows)
+            l_patch, (l_left, l_top) = fluid_L_patch(size, gradient, rows=rows)
+            del gradient
+            noise = noise_array(width, height, opacity=5, seed=noise_seed, cache_dir=None, rows=rows)
+
+            band = composite_layers(
+                (width, rows[1] - rows[0]),
+                bg_color,
+                [glass_card, (l_patch, (l_left, l_top - first_row)), noise]
+            )
+
+            png.write(np.asarray(band))
 
-    # Save
-    icon_rgb.save(output_path, 'PNG', quality=95)
     print(f"  ✓ Saved to {output_path}")
+    return bands
+
+
+def _share_array(array):
+    """
+    Copy an array into a new shared memory block.
+
+    Args:
+        array: NumPy array to share
+
+    Returns:
+        Tuple (SharedMemory, spec) where spec is (name, shape, dtype) for _attach_array
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach_array(spec):
+    """
+    Map a shared memory block created by _share_array without copying it.
+
+    Args:
+        spec: (name, shape, dtype) tuple
+
+    Returns:
+        Tuple (SharedMemory, read-only NumPy view)
+    """
+    name, shape, dtype = spec
+    # Pool workers share the parent's resource tracker, which unlinks the
+    # block once the parent is done with it
+    shm = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    array.flags.writeable = False
+    return shm, array
 
-    return icon_rgb
+
+def _shared_layers(size, noise_seed=NOISE_SEED, noise_cache_dir=NOISE_CACHE_DIR):
+    """
+    Render the appearance-independent inputs in the parent process.
+
+    Returns:
+        Dict of layer name to NumPy array
+    """
+    return {
+        "gradient": gradient_array(size, L_GRADIENT_COLORS),
+        "noise": noise_array(size[0], size[1], opacity=5, seed=noise_seed, cache_dir=noise_cache_dir),
+    }
+
+
+# Shared memory blocks attached by a pool worker; kept open for its lifetime
+_WORKER_SHM = []
+
+
+def _init_worker(size, specs, noise_seed, noise_cache_dir):
+    """
+    Pool initializer: seed the worker's layer cache from shared memory.
+
+    Args:
+        size: Canvas size the shared layers were rendered at
+        specs: Dict of layer name to shared memory spec
+        noise_seed: Seed the shared noise texture was generated with
+        noise_cache_dir: Noise cache directory, as passed to create_app_icon
+    """
+    gradient_shm, gradient = _attach_array(specs["gradient"])
+    noise_shm, noise = _attach_array(specs["noise"])
+    _WORKER_SHM.extend([gradient_shm, noise_shm])
+
+    LAYER_CACHE.put(gradient, gradient_array, size, L_GRADIENT_COLORS)
+    LAYER_CACHE.put(
+        Image.fromarray(noise, mode='RGBA'),
+        create_noise_texture,
+        size[0],
+        size[1],
+        opacity=5,
+        seed=noise_seed,
+        cache_dir=noise_cache_dir
+    )
+
+
+def _render_appearance(mode, output_path, icon_options):
+    """
+    Render one appearance, timing it and sampling peak memory.
+
+    Returns:
+        Tuple (mode, output_path, seconds, peak RSS in MB of the rendering process)
+    """
+    start = time.perf_counter()
+    options = dict(icon_options)
+    memory_budget_mb = options.pop("memory_budget_mb", None)
+    if memory_budget_mb:
+        render_app_icon_tiled(
+            mode=mode,
+            output_path=output_path,
+            size=options.get("size", (1024, 1024)),
+            memory_budget_mb=memory_budget_mb,
+            noise_seed=options.get("noise_seed", NOISE_SEED),
+        )
+    else:
+        create_app_icon(mode=mode, output_path=output_path, **options)
+    return mode, output_path, time.perf_counter() - start, _peak_rss_mb()
+
+
+def alternate_icon_set(variants_dir, mode):
+    """
+    Sibling icon set for an appearance iOS doesn't switch to by itself.
+
+    Alternate icons are separate icon sets (e.g. AppIcon-Alternate.appiconset
+    next to AppIcon.appiconset), selected by the app at runtime.
+    """
+    stem, ext = os.path.splitext(os.path.normpath(variants_dir))
+    return f"{stem}-{mode.capitalize()}{ext}"
+
+
+def master_path(output_dir, mode):
+    """
+    Where master mode writes an appearance's icon.
+
+    Returns:
+        output_dir/<filename>, or the same filename in the appearance's own
+        icon set (see alternate_icon_set) for alternate icons
+    """
+    if APPEARANCES[mode].get("own_icon_set"):
+        output_dir = alternate_icon_set(output_dir, mode)
+    return os.path.join(output_dir, APPEARANCES[mode]["filename"])
+
+
+def write_icon_set_contents(icon_path):
+    """
+    Give a new icon set a single-size Contents.json for its 1024 px master.
+
+    An existing Contents.json (e.g. from generate-icon-variants.py) is kept.
+    """
+    contents_path = os.path.join(os.path.dirname(icon_path), "Contents.json")
+    if os.path.exists(contents_path):
+        return
+    contents = {
+        "images": [{
+            "filename": os.path.basename(icon_path),
+            "idiom": "universal",
+            "platform": "ios",
+            "size": "1024x1024",
+        }],
+        "info": {"author": "xcode", "version": 1},
+    }
+    with open(contents_path, "w") as f:
+        json.dump(contents, f, indent=2)
+
+
+def render_appearances(modes, output_dir, jobs=1, **icon_options):
+    """
+    Render several appearances, optionally in a process pool.
+
+    With jobs > 1 the gradient and noise layers are rendered once in the
+    parent and handed to workers through shared memory instead of pickling.
+    Tiled renders (memory_budget_mb set) skip this: each worker renders its
+    own bands within the budget.
+
+    Args:
+        modes: Appearance names from APPEARANCES
+        output_dir: Directory to save icons (alternate icons go to their own
+            icon set next to it; see master_path)
+        jobs: Number of worker processes (1 renders in-process)
+        **icon_options: Extra create_app_icon arguments (blur_tolerance, noise_seed, ...),
+            or memory_budget_mb to render each appearance with render_app_icon_tiled
+
+    Returns:
+        List of (mode, output_path, seconds, peak_rss_mb) in the order of modes
+    """
+    tasks = [(mode, master_path(output_dir, mode)) for mode in modes]
+    for mode, path in tasks:
+        if APPEARANCES[mode].get("own_icon_set"):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_icon_set_contents(path)
+
+    if jobs <= 1 or len(tasks) <= 1:
+        return [_render_appearance(mode, path, icon_options) for mode, path in tasks]
+
+    if icon_options.get("memory_budget_mb"):
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            futures = [
+                pool.submit(_render_appearance, mode, path, icon_options)
+                for mode, path in tasks
+            ]
+            return [future.result() for future in futures]
+
+    size = tuple(icon_options.get("size", (1024, 1024)))
+    noise_seed = icon_options.get("noise_seed", NOISE_SEED)
+    noise_cache_dir = icon_options.get("noise_cache_dir", NOISE_CACHE_DIR)
+    blocks = []
+    try:
+        specs = {}
+        for name, array in _shared_layers(size, noise_seed, noise_cache_dir).items():
+            shm, specs[name] = _share_array(array)
+            blocks.append(shm)
+
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(tasks)),
+            initializer=_init_worker,
+            initargs=(size, specs, noise_seed, noise_cache_dir),
+        ) as pool:
+            futures = [
+                pool.submit(_render_appearance, mode, path, icon_options)
+                for mode, path in tasks
+            ]
+            return [future.result() for future in futures]
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+# Build manifest, kept next to the outputs so unchanged icons are skipped
+MANIFEST_FILENAME = ".icon-build.json"
+
+
+def script_version():
+    """Digest of this script's source (see generate-icon-variants.py script_version)."""
+    return load_variants_module().script_version(__file__)
+
+
+def render_key(mode, size=(1024, 1024), blur_tolerance=0, noise_seed=NOISE_SEED, version=None):
+    """
+    Hash of everything that determines an appearance's pixels.
+
+    Options that only change how the icon is produced (jobs, memory budget,
+    noise cache) are left out: they render the same pixels.
+
+    Args:
+        mode: Appearance name from APPEARANCES
+        size: Tuple of (width, height)
+        blur_tolerance: Pyramid blur tolerance (see blur_region)
+        noise_seed: Noise texture seed
+        version: Script version (default: script_version())
+
+    Returns:
+        Hex digest string
+    """
+    params = {
+        "script": version or script_version(),
+        "mode": mode,
+        "size": list(size),
+        "blur_tolerance": blur_tolerance,
+        "noise_seed": noise_seed,
+    }
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def load_manifest(output_dir):
+    """
+    Read the build manifest from an output directory.
+
+    Returns:
+        Dict mapping output filename to {"render_key", "sha256"}; empty if
+        the manifest is missing or unreadable
+    """
+    return load_variants_module().load_manifest(output_dir, MANIFEST_FILENAME)
+
+
+def save_manifest(output_dir, outputs):
+    """Write the build manifest atomically, only if it changed."""
+    load_variants_module().save_manifest(output_dir, outputs, MANIFEST_FILENAME)
+
+
+def is_up_to_date(outputs, path, key):
+    """
+    Whether an output was built from the same render key and is untouched since.
+
+    Args:
+        outputs: Manifest entries from load_manifest
+        path: Output file path
+        key: Current render_key for the output
+    """
+    entry = outputs.get(os.path.basename(path))
+    if not isinstance(entry, dict) or entry.get("render_key") != key:
+        return False
+    try:
+        return load_variants_module().file_digest(path) == entry.get("sha256")
+    except OSError:
+        return False
+
+
+def load_variants_module():
+    """
+    Import scripts/generate-icon-variants.py, which can't be imported by name.
+
+    Returns:
+        The module (cached after the first call)
+    """
+    if "generate_icon_variants" not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generate-icon-variants.py")
+        spec = importlib.util.spec_from_file_location("generate_icon_variants", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["generate_icon_variants"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["generate_icon_variants"]
+
+
+def render_and_derive(modes, variants_dir, size=(1024, 1024), jobs=1, force=False, **icon_options):
+    """
+    Render appearances and derive their iOS size variants in one process.
+
+    Each icon is handed to generate-icon-variants.py in memory, skipping the
+    master PNG encode/decode round trip. Variants are keyed on the render
+    parameters (see render_key), so an appearance whose variants are all up
+    to date isn't rendered at all. Masters of any --size are resampled to
+    the 1024 px the variants are cut from (the "fit" policy), so this never
+    prompts. The tinted appearance is derived from the light icon
+    (derive_tinted_master), as generate-icon-variants.py --derive-tinted
+    does, rather than rendered. Other appearances (alternate) get their own
+    icon set (see alternate_icon_set).
+
+    Args:
+        modes: Appearance names from APPEARANCES
+        variants_dir: Directory for the variants and Contents.json (usually
+            the AppIcon.appiconset)
+        size: Master canvas size
+        jobs: Threads resizing and encoding variants
+        force: Re-render everything, ignoring the variants manifest
+        **icon_options: Extra create_app_icon arguments (blur_tolerance, noise_seed, ...)
+
+    Returns:
+        Dict mapping each filename suffix (-<mode> for alternate icon sets)
+        to its variant paths
+
+    Raises:
+        ValueError: If tinted is requested without light, or a master
+            can't be used
+    """
+    variants = load_variants_module()
+    version = script_version()
+
+    def source(mode):
+        key = render_key(
+            mode,
+            size,
+            icon_options.get("blur_tolerance", 0),
+            icon_options.get("noise_seed", NOISE_SEED),
+            version,
+        )
+        return functools.partial(create_app_icon, mode=mode, output_path=None, size=size, **icon_options), key
+
+    derive_tinted = "tinted" in modes
+    if derive_tinted and "light" not in modes:
+        raise ValueError("The tinted icon is derived from the light icon; add light to --appearances")
+
+    masters = {
+        mode: source(mode) for mode in modes
+        if not APPEARANCES[mode].get("own_icon_set") and "derived_from" not in APPEARANCES[mode]
+    }
+    generated = {}
+    if masters:
+        generated = variants.generate_appearances(
+            {mode: master for mode, (master, _) in masters.items()},
+            variants_dir,
+            derive_tinted=derive_tinted,
+            force=force,
+            on_size_mismatch="fit",
+            master_keys={mode: key for mode, (_, key) in masters.items()},
+            jobs=jobs,
+        )
+        # Merged with the appearances already in the set, so rendering only
+        # some of them keeps the rest
+        variants.generate_contents_json(variants_dir, generated=generated)
+
+    for mode in modes:
+        if not APPEARANCES[mode].get("own_icon_set"):
+            continue
+        icon_set = alternate_icon_set(variants_dir, mode)
+        master, key = source(mode)
+        paths = variants.generate_variants(
+            master, icon_set, jobs=jobs, force=force, master_key=key, on_size_mismatch="fit"
+        )
+        variants.generate_contents_json(icon_set, suffixes=[""], generated={"": paths})
+        generated[f"-{mode}"] = paths
+
+    return generated
 
 
 def main():
     """Main function."""
-    print("🎨 LexiconFlow App Icon Generator")
-    print("   Creating glass morphism icon with fluid 'L' symbol\n")
+    parser = argparse.ArgumentParser(
+        description="Generate the LexiconFlow glass morphism app icon",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Light and dark icons (default)
+    python3 create-glass-morphism-icon.py
+
+    # All appearances on 4 cores
+    python3 create-glass-morphism-icon.py --appearances light,dark,tinted,alternate --jobs 4
+
+    # Re-render even if the build manifest says the icons are up to date
+    python3 create-glass-morphism-icon.py --force
+
+    # Render and derive every iOS size variant plus Contents.json in one process
+    # (tinted is derived from light; alternate goes to AppIcon-Alternate.appiconset/)
+    python3 create-glass-morphism-icon.py --appearances light,dark,tinted --variants-output AppIcon.appiconset/
+        """
+    )
+    parser.add_argument(
+        "--output", "-o",
+        default="LexiconFlow/LexiconFlow/Assets.xcassets/AppIcon.appiconset",
+        help="Output directory for generated icons (default: AppIcon.appiconset/)",
+    )
+    parser.add_argument(
+        "--appearances", "-a",
+        default="light,dark",
+        help=f"Comma-separated appearances to render ({', '.join(APPEARANCES)}; default: light,dark)",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=1024,
+        help="Master size in pixels; 256 for quick previews, 4096 for marketing (default: 1024)",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Render appearances in N worker processes; with --variants-output, "
+             "appearances render one after another and N threads resize and "
+             "encode the variants (default: 1)",
+    )
+    parser.add_argument(
+        "--blur-tolerance",
+        type=float,
+        default=0,
+        help="Allow a faster pyramid blur for the glass card with about this much "
+             "per-pixel error, 0-255, checked on sample tiles with a safety margin; "
+             "pays off from about 2048 px and 4 up (default: 0, exact blur)",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=int,
+        metavar="MB",
+        help="Render in horizontal bands streamed to the PNG, keeping peak RSS per "
+             "render process near MB (for 4K/8K masters)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=NOISE_SEED,
+        help=f"Noise texture seed; same seed, same bytes (default: {NOISE_SEED})",
+    )
+    parser.add_argument(
+        "--noise-cache-dir",
+        default=NOISE_CACHE_DIR,
+        help="Directory for cached noise textures (default: ~/.cache/lexiconflow/noise)",
+    )
+    parser.add_argument(
+        "--no-noise-cache",
+        action="store_true",
+        help="Don't read or write the noise texture cache",
+    )
+    parser.add_argument(
+        "--variants-output",
+        metavar="DIR",
+        help="Render in memory and write all iOS size variants and Contents.json "
+             "to DIR via generate-icon-variants.py, without the master PNGs",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=f"Re-render icons even if {MANIFEST_FILENAME} says they are up to date",
+    )
+    args = parser.parse_args()
+
+    if args.size < 16:
+        print(f"❌ Error: --size must be at least 16 (got {args.size})")
+        sys.exit(1)
+
+    modes = [mode.strip() for mode in args.appearances.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in APPEARANCES]
+    if unknown:
+        print(f"❌ Error: Unknown appearance(s): {', '.join(unknown)}")
+        print(f"Valid appearances: {', '.join(APPEARANCES)}")
+        sys.exit(1)
+
+    if args.memory_budget:
+        try:
+            _tile_rows(args.size, _blur_support(GLASS_BLUR_RADIUS * args.size), args.memory_budget)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        derived = [mode for mode in modes if "derived_from" in APPEARANCES[mode]]
+        if derived:
+            print(f"❌ Error: {', '.join(derived)} can't be rendered with --memory-budget "
+                  f"(derived from the whole light icon); render it separately without it")
+            sys.exit(1)
+
+    if args.variants_output:
+        if args.memory_budget:
+            print("❌ Error: --memory-budget streams masters to disk and can't be combined with --variants-output")
+            sys.exit(1)
+        print("🎨 LexiconFlow App Icon Generator (render and derive)")
+        print(f"   Creating {args.size}×{args.size} masters in memory → {args.variants_output}\n")
+        try:
+            render_and_derive(
+                modes,
+                args.variants_output,
+                size=(args.size, args.size),
+                jobs=args.jobs,
+                force=args.force,
+                blur_tolerance=args.blur_tolerance,
+                noise_seed=args.seed,
+                noise_cache_dir=None if args.no_noise_cache else args.noise_cache_dir,
+            )
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print("\n🚀 Ready to import into Xcode!")
+        return
 
     # Create output directory
-    output_dir = "LexiconFlow/LexiconFlow/Assets.xcassets/AppIcon.appiconset"
+    output_dir = args.output
     os.makedirs(output_dir, exist_ok=True)
 
-    # Generate light mode icon
-    light_path = os.path.join(output_dir, "app-icon.png")
-    create_app_icon(mode='light', output_path=light_path)
+    # Skip appearances whose inputs and output are unchanged since the last build
+    size = (args.size, args.size)
+    version = script_version()
+    manifest = load_manifest(output_dir)
+    keys = {
+        mode: render_key(mode, size, args.blur_tolerance, args.seed, version)
+        for mode in modes
+    }
+    stale = [
+        mode for mode in modes
+        if args.force or not is_up_to_date(
+            manifest, master_path(output_dir, mode), keys[mode]
+        )
+    ]
+    if not stale:
+        print(f"✅ App icons up to date ({', '.join(modes)}); use --force to re-render")
+        return
 
-    # Generate dark mode icon
-    dark_path = os.path.join(output_dir, "app-icon-dark.png")
-    create_app_icon(mode='dark', output_path=dark_path)
+    print("🎨 LexiconFlow App Icon Generator")
+    print(f"   Creating {args.size}×{args.size} glass morphism icon with fluid 'L' symbol\n")
+    for mode in modes:
+        if mode not in stale:
+            print(f"⏭️  {mode.capitalize()} mode up to date, skipping")
+
+    start = time.perf_counter()
+    results = render_appearances(
+        stale,
+        output_dir,
+        jobs=args.jobs,
+        size=size,
+        blur_tolerance=args.blur_tolerance,
+        noise_seed=args.seed,
+        noise_cache_dir=None if args.no_noise_cache else args.noise_cache_dir,
+        memory_budget_mb=args.memory_budget,
+    )
+    wall_time = time.perf_counter() - start
+
+    for mode, path, _, _ in results:
+        manifest[os.path.basename(path)] = {
+            "render_key": keys[mode],
+            "sha256": load_variants_module().file_digest(path),
+        }
+    try:
+        save_manifest(output_dir, manifest)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not write build manifest: {e}")
 
     print("\n✅ App icons created successfully!")
-    print(f"📂 Light mode: {light_path}")
-    print(f"📂 Dark mode: {dark_path}")
+    for mode, path, _, _ in results:
+        print(f"📂 {mode.capitalize()} mode: {path}")
+    if args.jobs <= 1 and not args.memory_budget:
+        print(f"♻️  Layer cache: {LAYER_CACHE.summary()}")
+
+    print("\n⏱️  Timing (peak RSS is per rendering process):")
+    for mode, _, seconds, peak_mb in results:
+        print(f"  {mode:<10} {seconds:6.2f}s  peak RSS {peak_mb:7.1f} MB")
+    # Per-mode times stretch under CPU contention, so their sum says nothing about
+    # parallel speedup; compare wall time across runs with different --jobs instead
+    print(f"  {'wall':<10} {wall_time:6.2f}s (jobs={args.jobs}, {os.cpu_count() or 1} CPUs)")
+
     print("\nNext steps:")
     print("  1. Review icons visually")
     print("  2. Generate all iOS size variants:")
-    print("     python3 scripts/generate-icon-variants.py --input LexiconFlow/LexiconFlow/Assets.xcassets/AppIcon.appiconset/app-icon.png")
+    print(f"     python3 scripts/generate-icon-variants.py --input {os.path.join(output_dir, 'app-icon.png')}")
     print("  3. Test in iOS Simulator")
 
 
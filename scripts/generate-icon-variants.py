@@ -13,14 +13,23 @@ Requirements:
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import os
+import struct
 import sys
+import tarfile
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 try:
-    from PIL import Image
+    from PIL import Image, ImageChops
 except ImportError:
     print("❌ Error: Pillow is required.")
     print("Install with: pip3 install Pillow")
@@ -46,24 +55,543 @@ IOS_ICON_SIZES = [
     (16, 16, 1, "app-icon-16.png"),
 ]
 
+# Appearance → filename suffix; Contents.json tags suffixed variants with
+# the matching luminosity appearance
+APPEARANCE_SUFFIXES = {
+    "light": "",
+    "dark": "-dark",
+    "tinted": "-tinted",
+}
 
-def generate_variants(
-    input_path: str,
-    output_dir: str,
+# What generate_variants accepts as a master: a PNG path, a decoded image or
+# array, or a callable producing one (so it's only rendered when needed)
+MasterSource = Union[str, Image.Image, Callable[[], Image.Image], Any]
+
+# Luminance differences from the background at or below this are the
+# master's noise texture, not content, and stay transparent when tinted
+TINTED_NOISE_FLOOR = 12
+
+# Expected master size, and what to do with masters of another size
+MASTER_SIZE = 1024
+SIZE_MISMATCH_POLICIES = ["prompt", "fail", "fit", "crop", "pad"]
+
+# Default --output: the app's icon set, or for --batch a build directory (an
+# icon set nested inside another isn't usable by Xcode)
+DEFAULT_OUTPUT_DIR = "LexiconFlow/LexiconFlow/Assets.xcassets/AppIcon.appiconset/"
+BATCH_OUTPUT_DIR = "build/icons/"
+
+# Resize strategies for generate_variants
+RESIZE_MODES = ["direct", "cascade"]
+
+# In cascade mode each variant is resampled from a pyramid level at least
+# this many times its size, so the final LANCZOS step still sees detail
+CASCADE_HEADROOM = 2
+
+
+def build_pyramid(master: Image.Image, min_size: int) -> List[Image.Image]:
+    """
+    Halve the master with Image.reduce until the next level would be too small.
+
+    Args:
+        master: Master image (level 0)
+        min_size: Smallest variant size the pyramid has to serve
+
+    Returns:
+        List of levels, largest (the master itself) first
+    """
+    levels = [master]
+    while min(levels[-1].size) // 2 >= min_size * CASCADE_HEADROOM:
+        levels.append(levels[-1].reduce(2))
+    return levels
+
+
+def cascade_source(levels: List[Image.Image], size: int) -> Image.Image:
+    """Smallest pyramid level at least CASCADE_HEADROOM × size (or the master)."""
+    for level in reversed(levels):
+        if min(level.size) >= size * CASCADE_HEADROOM:
+            return level
+    return levels[0]
+
+
+def variant_filename(filename: str, suffix: str = "") -> str:
+    """Insert a suffix (e.g. "-dark") before a variant filename's extension."""
+    if not suffix:
+        return filename
+    name, ext = os.path.splitext(filename)
+    return f"{name}{suffix}{ext}"
+
+
+def build_render_plan(
     suffix: str = "",
+    sizes: List[Tuple[int, int, int, str]] = IOS_ICON_SIZES,
+) -> Dict[int, List[Tuple[int, int, str]]]:
+    """
+    Group the icon table by pixel size, so each size is rendered once.
+
+    Args:
+        suffix: Optional suffix to add to filenames (e.g., "-dark")
+        sizes: Icon table entries (export_size, display_size, scale, filename)
+
+    Returns:
+        Dict mapping export size to its (display_size, scale, filename)
+        entries, in table order
+    """
+    plan: Dict[int, List[Tuple[int, int, str]]] = {}
+    for export_size, display_size, scale, filename in sizes:
+        plan.setdefault(export_size, []).append(
+            (display_size, scale, variant_filename(filename, suffix))
+        )
+    return plan
+
+
+def print_render_plan(plan: Dict[int, List[Tuple[int, int, str]]]) -> None:
+    """Print a render plan and the resizes and encodes it saves."""
+    files = sum(len(entries) for entries in plan.values())
+    print(f"🗺️  Render plan: {files} files from {len(plan)} unique sizes")
+    for export_size, entries in plan.items():
+        names = ", ".join(filename for _, _, filename in entries)
+        print(f"  {export_size:>4}px → {names}")
+    print(f"  Saves {files - len(plan)} of {files} resizes and PNG encodes")
+
+
+def render_size(
+    levels: List[Image.Image],
+    export_size: int,
     quality: int = 95,
-) -> List[str]:
+    report_deviation: bool = False,
+) -> Tuple[bytes, int, int]:
     """
-    Generate all iOS icon variants from a master image.
+    Resize and PNG-encode one variant size.
+
+    Safe to run on several threads at once: Pillow releases the GIL while
+    resampling and compressing, and the (already loaded) levels are only read.
+
+    Args:
+        levels: Pyramid from build_pyramid, or just [master] for direct resizing
+        export_size: Variant size in pixels
+        quality: PNG quality (1-100)
+        report_deviation: Also resize the master directly and measure the
+            max pixel deviation from it
+
+    Returns:
+        Tuple of (PNG bytes, width of the level resampled from, max deviation or -1)
+    """
+    # Resize using high-quality Lanczos resampling
+    source = cascade_source(levels, export_size)
+    resized = source.resize(
+        (export_size, export_size),
+        Image.Resampling.LANCZOS
+    )
+
+    deviation = -1
+    if report_deviation:
+        direct = levels[0].resize((export_size, export_size), Image.Resampling.LANCZOS)
+        deviation = max_deviation(resized, direct)
+
+    # Encode as PNG
+    buffer = io.BytesIO()
+    resized.save(buffer, "PNG", quality=quality)
+    return buffer.getvalue(), source.width, deviation
+
+
+def write_variant(data: bytes, output_path: str, link_to: str = None) -> None:
+    """
+    Write encoded PNG bytes, or hardlink to an identical file already written.
+
+    The file is written (or linked) under a temporary name and renamed into
+    place, so an interrupted run never leaves a half-written PNG.
+
+    Args:
+        data: Encoded PNG
+        output_path: Destination path
+        link_to: Path of a file with the same bytes to hardlink instead;
+            falls back to writing if the filesystem can't link
+    """
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    if link_to:
+        try:
+            os.link(link_to, tmp_path)
+            os.replace(tmp_path, output_path)
+            return
+        except OSError:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+
+
+class ArchiveWriter:
+    """
+    Stream variants and Contents.json into a zip or tar archive.
+
+    Nothing is written to disk except the archive itself (or nothing at all
+    for a tar on stdout). Zip members are stored, not deflated, since PNGs
+    are already compressed. Timestamps are fixed, so the same icons always
+    give the same archive bytes.
+
+    Example:
+        with ArchiveWriter("icons.zip") as archive:
+            generate_variants("app-icon.png", "AppIcon.appiconset", archive=archive)
+    """
+
+    # 1980-01-01, the earliest timestamp zip supports
+    EPOCH = 315532800
+
+    def __init__(self, target: str, prefix: str = "AppIcon.appiconset"):
+        """
+        Open an archive for writing.
+
+        Args:
+            target: Path ending in .zip or .tar, or "-" for a tar on stdout
+            prefix: Directory the members are stored under
+        """
+        self.target = target
+        self.prefix = prefix.strip("/")
+        self._zip = None
+        self._tar = None
+        if target == "-":
+            self._tar = tarfile.open(fileobj=sys.stdout.buffer, mode="w|")
+        elif target.endswith(".zip"):
+            self._zip = zipfile.ZipFile(target, "w", compression=zipfile.ZIP_STORED)
+        elif target.endswith(".tar"):
+            self._tar = tarfile.open(target, "w")
+        else:
+            raise ValueError(f"Archive must end in .zip or .tar, or be - for stdout: {target}")
+
+    def member_name(self, filename: str) -> str:
+        """Archive path of a file in the icon set."""
+        return f"{self.prefix}/{filename}" if self.prefix else filename
+
+    def add(self, filename: str, data: bytes, link_to: Optional[str] = None) -> None:
+        """
+        Add a member.
+
+        Args:
+            filename: Name within the icon set
+            data: File contents
+            link_to: Name of an identical member already added; stored as a
+                hardlink in tar archives (zip has no links and stores a copy)
+        """
+        if self._zip is not None:
+            info = zipfile.ZipInfo(self.member_name(filename), date_time=(1980, 1, 1, 0, 0, 0))
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, data, compress_type=zipfile.ZIP_STORED)
+            return
+
+        info = tarfile.TarInfo(self.member_name(filename))
+        info.mtime = self.EPOCH
+        info.mode = 0o644
+        if link_to:
+            info.type = tarfile.LNKTYPE
+            info.linkname = self.member_name(link_to)
+            self._tar.addfile(info)
+        else:
+            info.size = len(data)
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        """Finish the archive (central directory / end-of-archive blocks)."""
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+            if self.target == "-":
+                sys.stdout.buffer.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+
+# Sidecar manifest in the output directory, recording what each variant was
+# rendered from so unchanged variants are skipped
+MANIFEST_FILENAME = ".variants-manifest.json"
+
+
+def script_version(script: Optional[str] = None) -> str:
+    """
+    Digest of a script's source; any code change invalidates its manifest.
+
+    Args:
+        script: Path of the script (default: this one); create-glass-morphism-icon.py
+            passes its own __file__
+
+    Returns:
+        Short hex digest string
+    """
+    return file_digest(os.path.abspath(script or __file__))[:16]
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def variant_key(
+    master_digest: str,
+    export_size: int,
+    quality: int = 95,
+    resize_mode: str = "direct",
+    version: Optional[str] = None,
+) -> str:
+    """
+    Hash of everything that determines a variant's bytes.
+
+    Args:
+        master_digest: SHA-256 of the master file (or of how it was derived)
+        export_size: Variant size in pixels
+        quality: PNG quality
+        resize_mode: Resize strategy (see RESIZE_MODES)
+        version: Script version (default: script_version())
+
+    Returns:
+        Hex digest string
+    """
+    params = {
+        "script": version or script_version(),
+        "master": master_digest,
+        "size": export_size,
+        "quality": quality,
+        "resize_mode": resize_mode,
+    }
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def load_manifest(output_dir: str, filename: str = MANIFEST_FILENAME) -> Dict[str, Dict[str, str]]:
+    """
+    Read a build manifest from an output directory.
+
+    Args:
+        output_dir: Directory holding the manifest
+        filename: Manifest name (default: the variants manifest)
+
+    Returns:
+        Dict mapping output filename to its entry (e.g. {"input_key",
+        "sha256"}); empty if the manifest is missing or unreadable
+    """
+    try:
+        with open(os.path.join(output_dir, filename)) as f:
+            outputs = json.load(f).get("outputs", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+    return outputs if isinstance(outputs, dict) else {}
+
+
+def save_manifest(
+    output_dir: str,
+    outputs: Dict[str, Dict[str, str]],
+    filename: str = MANIFEST_FILENAME,
+) -> None:
+    """Write a build manifest atomically, only if it changed (see write_text_if_changed)."""
+    write_text_if_changed(
+        os.path.join(output_dir, filename),
+        json.dumps({"outputs": outputs}, indent=2, sort_keys=True) + "\n",
+    )
+
+
+def write_text_if_changed(path: str, text: str) -> bool:
+    """
+    Atomically replace a text file, leaving it untouched if the text is the same.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def stale_sizes(
+    outputs: Dict[str, Dict[str, str]],
+    output_dir: str,
+    suffix: str,
+    master_digest: str,
+    quality: int = 95,
+    resize_mode: str = "direct",
+) -> List[int]:
+    """
+    Sizes of a master whose variants need rendering.
+
+    A size is up to date when every filename sharing it was recorded with
+    the same input key and still has the recorded contents.
+
+    Args:
+        outputs: Manifest entries from load_manifest
+        output_dir: Directory containing the variants
+        suffix: Filename suffix of the master's appearance
+        master_digest: SHA-256 of the master (see variant_key)
+        quality: PNG quality
+        resize_mode: Resize strategy
+
+    Returns:
+        Export sizes to render, in plan order
+    """
+    version = script_version()
+    stale = []
+    for export_size, entries in build_render_plan(suffix).items():
+        key = variant_key(master_digest, export_size, quality, resize_mode, version)
+        for _, _, filename in entries:
+            entry = outputs.get(filename)
+            try:
+                current = (
+                    isinstance(entry, dict)
+                    and entry.get("input_key") == key
+                    and file_digest(os.path.join(output_dir, filename)) == entry.get("sha256")
+                )
+            except OSError:
+                current = False
+            if not current:
+                stale.append(export_size)
+                break
+    return stale
+
+
+def max_deviation(image: Image.Image, reference: Image.Image) -> int:
+    """Largest per-channel difference between two images of the same size and mode."""
+    extrema = ImageChops.difference(image, reference).getextrema()
+    if isinstance(extrema[0], tuple):
+        return max(high for _, high in extrema)
+    return extrema[1]
+
+
+def _border_median(gray: Image.Image) -> int:
+    """Median of an 'L' image's outermost rows and columns (the icon background)."""
+    width, height = gray.size
+    histogram = [0] * 256
+    for box in ((0, 0, width, 1), (0, height - 1, width, height),
+                (0, 1, 1, height - 1), (width - 1, 1, width, height - 1)):
+        for value, count in enumerate(gray.crop(box).histogram()):
+            histogram[value] += count
+
+    half, seen = sum(histogram) / 2, 0
+    for value, count in enumerate(histogram):
+        seen += count
+        if seen >= half:
+            return value
+    return 0
+
+
+def derive_tinted_master(light: Image.Image) -> Image.Image:
+    """
+    Derive the iOS 18 tinted appearance from the light master.
+
+    The system tints a grayscale icon, so the result is white on
+    transparent: alpha is each pixel's luminance distance from the
+    background, stretched to the full range. Everything is whole-image
+    Pillow operations (convert, difference, LUT, multiply), with no
+    per-pixel Python and no second render.
+
+    Args:
+        light: Decoded light master (RGB or RGBA)
+
+    Returns:
+        RGBA image the size of the master
+    """
+    gray = light.convert("L")
+    background = _border_median(gray)
+    distance = ImageChops.difference(gray, Image.new("L", gray.size, background))
+
+    peak = max(distance.getextrema()[1], TINTED_NOISE_FLOOR + 1)
+    scale = 255 / (peak - TINTED_NOISE_FLOOR)
+    alpha = distance.point(
+        [0 if v <= TINTED_NOISE_FLOOR else min(255, round((v - TINTED_NOISE_FLOOR) * scale)) for v in range(256)]
+    )
+    if "A" in light.getbands():
+        alpha = ImageChops.multiply(alpha, light.getchannel("A"))
+
+    white = Image.new("L", gray.size, 255)
+    return Image.merge("RGBA", (white, white, white, alpha))
+
+
+def conform_master(master: Image.Image, policy: str = "prompt", label: str = "Master") -> Image.Image:
+    """
+    Bring an off-size master to MASTER_SIZE×MASTER_SIZE according to a policy.
+
+    Policies:
+        prompt: Ask whether to continue with the master as it is (only on an
+            interactive terminal; fails otherwise, so CI never hangs)
+        fail: Raise ValueError
+        fit: Resample the whole master to the target size
+        crop: Center-crop to a square, then resample
+        pad: Pad to a square with the master's corner color, then resample
+
+    Larger masters are downsampled with Pillow's reducing_gap, which reduces
+    by an integer factor first and only LANCZOS-filters the last step.
+
+    Args:
+        master: Decoded master image
+        policy: One of SIZE_MISMATCH_POLICIES
+        label: Name used in messages (e.g. the file path)
+
+    Returns:
+        The master, unchanged if it already has the right size
+    """
+    if policy not in SIZE_MISMATCH_POLICIES:
+        raise ValueError(f"Unknown size mismatch policy: {policy} (expected one of {', '.join(SIZE_MISMATCH_POLICIES)})")
+
+    width, height = master.size
+    if (width, height) == (MASTER_SIZE, MASTER_SIZE):
+        return master
+
+    mismatch = f"{label} is {width}×{height}, expected {MASTER_SIZE}×{MASTER_SIZE}"
+    if policy == "prompt":
+        if not sys.stdin.isatty():
+            raise ValueError(f"{mismatch}; use --on-size-mismatch=fit|crop|pad to fix it up unattended")
+        print(f"⚠️  Warning: {mismatch}")
+        response = input("Continue anyway? (y/n): ")
+        if response.lower() != 'y':
+            raise ValueError(mismatch)
+        return master
+    if policy == "fail":
+        raise ValueError(mismatch)
+
+    if policy == "crop":
+        side = min(width, height)
+        left, top = (width - side) // 2, (height - side) // 2
+        master = master.crop((left, top, left + side, top + side))
+    elif policy == "pad":
+        side = max(width, height)
+        padded = Image.new(master.mode, (side, side), master.getpixel((0, 0)))
+        if master.mode == "P":
+            padded.putpalette(master.getpalette())
+        padded.paste(master, ((side - width) // 2, (side - height) // 2))
+        master = padded
+
+    print(f"⚠️  {mismatch}; {policy} → {MASTER_SIZE}×{MASTER_SIZE}")
+    reducing_gap = 3.0 if min(master.size) >= 2 * MASTER_SIZE else None
+    return master.resize((MASTER_SIZE, MASTER_SIZE), Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
+
+
+def load_master(input_path: str, on_size_mismatch: str = "prompt") -> Image.Image:
+    """
+    Open and decode a master icon, fixing up its size if it isn't 1024×1024.
 
     Args:
         input_path: Path to 1024×1024 master PNG
-        output_dir: Directory to save variants
-        suffix: Optional suffix to add to filenames (e.g., "-dark")
-        quality: PNG quality (1-100, default 95)
+        on_size_mismatch: Policy for off-size masters (see conform_master)
 
     Returns:
-        List of generated file paths
+        Decoded PIL Image
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file can't be decoded or the size policy rejects it
     """
     # Validate input
     if not os.path.exists(input_path):
@@ -73,76 +601,494 @@ def generate_variants(
     print(f"📱 Loading master icon: {input_path}")
     try:
         master = Image.open(input_path)
-        master_width, master_height = master.size
+        master.load()  # Decode up front; worker threads must not race on the lazy load
+    except Exception as e:
+        raise ValueError(f"Error loading image {input_path}: {e}") from e
 
-        if master_width != 1024 or master_height != 1024:
-            print(f"⚠️  Warning: Master size is {master_width}×{master_height}, expected 1024×1024")
-            response = input("Continue anyway? (y/n): ")
-            if response.lower() != 'y':
-                sys.exit(1)
+    return conform_master(master, on_size_mismatch, label=input_path)
 
-    except Exception as e:
-        print(f"❌ Error loading image: {e}")
-        sys.exit(1)
+
+def render_masters(
+    masters: List[Tuple[str, Image.Image]],
+    output_dir: str,
+    quality: int = 95,
+    resize_mode: str = "direct",
+    report_deviation: bool = False,
+    hardlink: bool = False,
+    jobs: int = 1,
+    sizes: Optional[Dict[str, List[int]]] = None,
+    archive: Optional[ArchiveWriter] = None,
+) -> Dict[str, List[str]]:
+    """
+    Generate the variants of one or more decoded masters on a shared thread pool.
+
+    Args:
+        masters: (suffix, master image) pairs, e.g. [("", light), ("-dark", dark)]
+        output_dir: Directory to save variants
+        quality: PNG quality (1-100, default 95)
+        resize_mode: "direct" or "cascade" (see generate_variants)
+        report_deviation: Report each variant's max pixel deviation from
+            direct LANCZOS (cascade mode only)
+        hardlink: Hardlink filenames that share a pixel size instead of
+            writing the same bytes again
+        jobs: Number of threads resizing and encoding concurrently; files
+            are written and reported in table order either way
+        sizes: Optional mapping of suffix to the export sizes to render;
+            other sizes are left as they are (see stale_sizes)
+        archive: Stream variants into this ArchiveWriter instead of
+            writing files to output_dir
+
+    Returns:
+        Dict mapping each suffix to its variant file paths (rendered or
+        left unchanged), in table order
+    """
+    if resize_mode not in RESIZE_MODES:
+        raise ValueError(f"Unknown resize mode: {resize_mode} (expected one of {', '.join(RESIZE_MODES)})")
 
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Generate each variant
-    generated_files = []
-    for export_size, display_size, scale, filename in IOS_ICON_SIZES:
-        # Add suffix if provided
-        if suffix:
-            name, ext = os.path.splitext(filename)
-            filename = f"{name}{suffix}{ext}"
-
-        output_path = os.path.join(output_dir, filename)
-
-        # Resize using high-quality Lanczos resampling
-        resized = master.resize(
-            (export_size, export_size),
-            Image.Resampling.LANCZOS
+    if archive is None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    report = report_deviation and resize_mode == "cascade"
+    min_size = min(size for size, _, _, _ in IOS_ICON_SIZES)
+    generated: Dict[str, List[str]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        # Queue every (master, unique size) before writing anything, so all
+        # appearances resize and encode in parallel
+        queued = []
+        for suffix, master in masters:
+            levels = build_pyramid(master, min_size) if resize_mode == "cascade" else [master]
+            plan = build_render_plan(suffix)
+            selected = plan if sizes is None else sizes.get(suffix, plan)
+            rendered = {
+                export_size: pool.submit(render_size, levels, export_size, quality, report)
+                for export_size in plan if export_size in selected
+            }
+            queued.append((suffix, plan, rendered))
+
+        # Write and report in plan order, whatever order the threads finish in
+        for suffix, plan, rendered in queued:
+            if len(masters) > 1:
+                appearance = next((name for name, sfx in APPEARANCE_SUFFIXES.items() if sfx == suffix), suffix.lstrip("-"))
+                print(f"\n🎨 {appearance.capitalize()} variants:")
+            worst_deviation = 0
+            for export_size, entries in plan.items():
+                if export_size not in rendered:
+                    for _, _, filename in entries:
+                        print(f"  ⏭️  Unchanged {filename}")
+                    continue
+
+                data, source_width, deviation = rendered[export_size].result()
+                note = ""
+                if report:
+                    worst_deviation = max(worst_deviation, deviation)
+                    note = f", from {source_width}px, max Δ {deviation}"
+
+                first_path = None
+                for display_size, scale, filename in entries:
+                    output_path = os.path.join(output_dir, filename)
+                    if archive is not None:
+                        link_to = os.path.basename(first_path) if hardlink and first_path else None
+                        archive.add(filename, data, link_to=link_to)
+                    else:
+                        write_variant(data, output_path, link_to=first_path if hardlink else None)
+                    first_path = first_path or output_path
+
+                    shared = " (shared)" if output_path != first_path else ""
+                    print(f"  ✓ Generated {filename} ({export_size}×{export_size}, {display_size}@{scale}x{note}){shared}")
+
+            if report:
+                print(f"📏 Max pixel deviation from direct LANCZOS: {worst_deviation}/255")
+
+            generated[suffix] = [
+                os.path.join(output_dir, variant_filename(filename, suffix))
+                for _, _, _, filename in IOS_ICON_SIZES
+            ]
+
+    return generated
+
+
+def as_image(master) -> Image.Image:
+    """Accept a PIL Image or an (H, W[, C]) uint8 NumPy array as a master."""
+    if isinstance(master, Image.Image):
+        return master
+    if hasattr(master, "__array_interface__"):
+        return Image.fromarray(master)
+    raise TypeError(f"Expected a PIL Image or NumPy array, got {type(master).__name__}")
+
+
+def pixel_digest(image: Image.Image) -> str:
+    """SHA-256 of an image's mode, size and pixels."""
+    digest = hashlib.sha256(f"{image.mode}:{image.size}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def master_source(
+    master: MasterSource,
+    master_key: Optional[str] = None,
+    on_size_mismatch: str = "prompt",
+) -> Tuple[str, Callable[[], Image.Image]]:
+    """
+    Identify a master and return a memoized loader that produces it on first use.
+
+    Files are hashed from their raw bytes and in-memory images from their
+    pixels, so masters whose variants are all up to date are never decoded.
+
+    Args:
+        master: Path to a master PNG, a PIL Image, a NumPy array, or a
+            callable returning either (rendered only if needed)
+        master_key: Digest identifying the master's content; required for
+            callables, overrides the file/pixel hash otherwise
+        on_size_mismatch: Policy for off-size masters (see conform_master)
+
+    Returns:
+        Tuple of (master digest, loader returning the master image)
+    """
+    def keyed(digest, size=None):
+        # Fix-up policies change an off-size master's pixels, so they're part
+        # of its key (size None: unknown until rendered)
+        if on_size_mismatch in ("fit", "crop", "pad") and size != (MASTER_SIZE, MASTER_SIZE):
+            return hashlib.sha256(f"{digest}:{on_size_mismatch}".encode()).hexdigest()
+        return digest
+
+    if isinstance(master, (str, os.PathLike)):
+        input_path = os.fspath(master)
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        try:
+            size = read_png_header(input_path)[:2]
+        except (OSError, ValueError, struct.error):
+            size = None  # Not a PNG (or unreadable); load_master reports it
+        return (
+            keyed(master_key or file_digest(input_path), size),
+            functools.lru_cache(maxsize=None)(lambda: load_master(input_path, on_size_mismatch)),
         )
 
-        # Save as PNG
-        resized.save(output_path, "PNG", quality=quality)
-        generated_files.append(output_path)
+    if callable(master):
+        if not master_key:
+            raise ValueError("A master_key is required when the master is a callable")
+        return keyed(master_key), functools.lru_cache(maxsize=None)(
+            lambda: conform_master(as_image(master()), on_size_mismatch)
+        )
+
+    image = as_image(master)
+    return keyed(master_key or pixel_digest(image), image.size), functools.lru_cache(maxsize=None)(
+        lambda: conform_master(image, on_size_mismatch)
+    )
+
+
+def _generate_incremental(
+    sources: List[Tuple[str, str, Callable[[], Image.Image]]],
+    output_dir: str,
+    force: bool = False,
+    **options,
+) -> Dict[str, List[str]]:
+    """
+    Render the stale variants of each master and update the sidecar manifest.
+
+    Args:
+        sources: (suffix, master digest, loader) per appearance
+        output_dir: Directory to save variants
+        force: Render every variant, ignoring the manifest
+        **options: render_masters options (including archive)
+
+    Returns:
+        Dict mapping each suffix to its variant file paths, in table order
+    """
+    quality = options.get("quality", 95)
+    resize_mode = options.get("resize_mode", "direct")
+
+    # Archives are built from scratch every time; there's nothing on disk to skip
+    streaming = options.get("archive") is not None
+    force = force or streaming
+    outputs = {} if streaming else load_manifest(output_dir)
+
+    stale = {
+        suffix: list(build_render_plan(suffix)) if force
+        else stale_sizes(outputs, output_dir, suffix, digest, quality, resize_mode)
+        for suffix, digest, _ in sources
+    }
+
+    # Decode (or derive) only the masters that have something to render
+    masters = [(suffix, load()) for suffix, _, load in sources if stale[suffix]]
+    generated = render_masters(masters, output_dir, sizes=stale, **options) if masters else {}
+
+    version = script_version()
+    for suffix, digest, _ in sources:
+        if suffix not in generated:
+            name = next((name for name, sfx in APPEARANCE_SUFFIXES.items() if sfx == suffix), suffix.lstrip("-"))
+            print(f"⏭️  {name.capitalize()} variants unchanged, skipping")
+            generated[suffix] = [
+                os.path.join(output_dir, variant_filename(filename, suffix))
+                for _, _, _, filename in IOS_ICON_SIZES
+            ]
+        if streaming:
+            continue
+        plan = build_render_plan(suffix)
+        for export_size in stale[suffix]:
+            key = variant_key(digest, export_size, quality, resize_mode, version)
+            for _, _, filename in plan[export_size]:
+                outputs[filename] = {
+                    "input_key": key,
+                    "sha256": file_digest(os.path.join(output_dir, filename)),
+                }
+
+    if any(stale.values()) and not streaming:
+        save_manifest(output_dir, outputs)
+    return {suffix: generated[suffix] for suffix, _, _ in sources}
+
+
+def generate_variants(
+    master: MasterSource,
+    output_dir: str,
+    suffix: str = "",
+    quality: int = 95,
+    resize_mode: str = "direct",
+    report_deviation: bool = False,
+    hardlink: bool = False,
+    jobs: int = 1,
+    force: bool = False,
+    master_key: Optional[str] = None,
+    archive: Optional[ArchiveWriter] = None,
+    on_size_mismatch: str = "prompt",
+) -> List[str]:
+    """
+    Generate all iOS icon variants from a master image.
+
+    Usable as a library function: the master can be handed over in memory
+    (e.g. straight from create_app_icon) instead of via a PNG on disk.
+
+    Variants recorded in the output directory's manifest (MANIFEST_FILENAME)
+    with the same master and settings, and unmodified since, are skipped;
+    if none need rendering the master isn't even decoded.
+
+    Args:
+        master: 1024×1024 master as a PNG path, PIL Image or NumPy array, or
+            a callable returning one (called only if a variant is stale)
+        output_dir: Directory to save variants
+        suffix: Optional suffix to add to filenames (e.g., "-dark")
+        quality: PNG quality (1-100, default 95)
+        resize_mode: "direct" resamples every variant from the master with
+            LANCZOS; "cascade" builds a 1024→512→256… pyramid with
+            Image.reduce and resamples each variant from the nearest level
+            at least twice its size
+        report_deviation: Also resize directly and report each variant's
+            max pixel deviation from it (cascade mode only)
+        hardlink: Hardlink filenames that share a pixel size (e.g.
+            app-icon-128.png and app-icon-64@2x.png) instead of writing
+            the same bytes again
+        jobs: Number of threads resizing and encoding sizes concurrently;
+            files are written and reported in table order either way
+        force: Render every variant, ignoring the manifest
+        master_key: Digest identifying the master (see master_source);
+            required when master is a callable
+        archive: Stream the variants into this ArchiveWriter instead of
+            output_dir (every variant is rendered; no manifest)
+        on_size_mismatch: What to do if the master isn't 1024×1024: prompt,
+            fail, fit, crop or pad (see conform_master)
 
-        print(f"  ✓ Generated {filename} ({export_size}×{export_size}, {display_size}@{scale}x)")
+    Returns:
+        List of generated file paths
+    """
+    digest, load = master_source(master, master_key, on_size_mismatch)
+    generated_files = _generate_incremental(
+        [(suffix, digest, load)],
+        output_dir,
+        force=force,
+        quality=quality,
+        resize_mode=resize_mode,
+        report_deviation=report_deviation,
+        hardlink=hardlink,
+        jobs=jobs,
+        archive=archive,
+    )[suffix]
 
-    print(f"\n✅ Generated {len(generated_files)} icon variants in {output_dir}")
+    destination = archive.target if archive is not None else output_dir
+    print(f"\n✅ {len(generated_files)} icon variants up to date in {destination}")
     return generated_files
 
 
+def generate_appearances(
+    masters: Dict[str, str],
+    output_dir: str,
+    derive_tinted: bool = False,
+    force: bool = False,
+    on_size_mismatch: str = "prompt",
+    master_keys: Optional[Dict[str, str]] = None,
+    **options,
+) -> Dict[str, List[str]]:
+    """
+    Generate variants for several appearances in one pass.
+
+    Each master is decoded at most once (and only if some of its variants
+    are stale), and all appearances share one thread pool.
+
+    Args:
+        masters: Mapping of appearance name (see APPEARANCE_SUFFIXES) to
+            master PNG path, PIL Image, NumPy array or callable (see
+            master_source)
+        output_dir: Directory to save variants
+        derive_tinted: Derive the tinted appearance from the light master
+            (see derive_tinted_master) unless a tinted master is given
+        force: Render every variant, ignoring the manifest
+        on_size_mismatch: Policy for off-size masters (see conform_master)
+        master_keys: Optional mapping of appearance name to master digest;
+            required for callable masters (see master_source)
+        **options: quality, resize_mode, report_deviation, hardlink, jobs
+            and archive (see generate_variants)
+
+    Returns:
+        Dict mapping each filename suffix to its generated file paths
+    """
+    master_keys = master_keys or {}
+    unknown = [name for name in masters if name not in APPEARANCE_SUFFIXES]
+    if unknown:
+        raise ValueError(
+            f"Unknown appearance(s): {', '.join(unknown)} (expected {', '.join(APPEARANCE_SUFFIXES)})"
+        )
+
+    sources = {
+        name: master_source(master, master_keys.get(name), on_size_mismatch)
+        for name, master in masters.items()
+    }
+    if derive_tinted and "tinted" not in sources:
+        if "light" not in sources:
+            raise ValueError("Deriving the tinted appearance needs a light master")
+        light_digest, load_light = sources["light"]
+
+        def load_tinted():
+            print("🩶 Deriving tinted master from the light master")
+            return derive_tinted_master(load_light())
+
+        derived_digest = hashlib.sha256(f"tinted:{light_digest}".encode()).hexdigest()
+        sources["tinted"] = (derived_digest, load_tinted)
+
+    generated = _generate_incremental(
+        [(APPEARANCE_SUFFIXES[name], digest, load) for name, (digest, load) in sources.items()],
+        output_dir,
+        force=force,
+        **options,
+    )
+
+    total = sum(len(files) for files in generated.values())
+    archive = options.get("archive")
+    destination = archive.target if archive is not None else output_dir
+    print(f"\n✅ {total} icon variants up to date for {', '.join(sources)} in {destination}")
+    return generated
+
+
+def generate_batch(
+    input_dir: str,
+    output_root: str,
+    on_size_mismatch: str = "fail",
+    derive_tinted: bool = False,
+    **options,
+) -> Dict[str, Optional[str]]:
+    """
+    Generate an icon set for every master in a directory, without prompting.
+
+    Masters are grouped by name: NAME.png is the light master, NAME-dark.png
+    and NAME-tinted.png the other appearances. Each group becomes
+    output_root/NAME.appiconset with its own Contents.json and manifest. A
+    failing set is reported and skipped; the rest still run.
+
+    Args:
+        input_dir: Directory of master PNGs
+        output_root: Directory to create the icon sets in
+        on_size_mismatch: Policy for off-size masters; "prompt" is treated
+            as "fail" so bulk runs never stall
+        derive_tinted: Derive tinted from light where no tinted master exists
+        **options: generate_appearances options (quality, jobs, force, ...)
+
+    Returns:
+        Dict mapping set name to None on success or the error message
+    """
+    if on_size_mismatch == "prompt":
+        on_size_mismatch = "fail"
+
+    groups: Dict[str, Dict[str, str]] = {}
+    for entry in sorted(os.listdir(input_dir)):
+        stem, ext = os.path.splitext(entry)
+        if ext.lower() != ".png":
+            continue
+        appearance = "light"
+        for name, suffix in APPEARANCE_SUFFIXES.items():
+            if suffix and stem.endswith(suffix):
+                stem, appearance = stem[:-len(suffix)], name
+                break
+        groups.setdefault(stem, {})[appearance] = os.path.join(input_dir, entry)
+
+    results: Dict[str, Optional[str]] = {}
+    for name, found in groups.items():
+        masters = {appearance: found[appearance] for appearance in APPEARANCE_SUFFIXES if appearance in found}
+        output_dir = os.path.join(output_root, f"{name}.appiconset")
+        print(f"\n📦 {name} ({', '.join(masters)}) → {output_dir}")
+        try:
+            generated = generate_appearances(
+                masters,
+                output_dir,
+                derive_tinted=derive_tinted and "light" in masters,
+                on_size_mismatch=on_size_mismatch,
+                **options,
+            )
+            generate_contents_json(output_dir, generated=generated)
+            results[name] = None
+        except Exception as e:
+            print(f"  ❌ {name}: {e}")
+            results[name] = str(e)
+
+    return results
+
+
 def generate_contents_json(
     output_dir: str,
-    suffixes: List[str] = ["", "-dark"],
+    suffixes: List[str] = ["", "-dark", "-tinted"],
+    generated: Optional[Dict[str, List[str]]] = None,
+    archive: Optional[ArchiveWriter] = None,
 ) -> str:
     """
     Generate Contents.json for Xcode asset catalog.
 
     Args:
         output_dir: Directory containing icon PNGs
-        suffixes: List of filename suffixes (e.g., ["", "-dark"])
+        suffixes: List of filename suffixes (e.g., ["", "-dark", "-tinted"])
+        generated: Files just written, as returned by render_masters or
+            generate_appearances. Its suffixes' entries come from it without
+            probing the directory; the other suffixes are still probed, so a
+            run that rendered only some appearances keeps the rest of the set
+        archive: Add Contents.json to this ArchiveWriter instead of
+            output_dir (requires generated; only generated files are listed,
+            as the archive holds nothing else)
 
     Returns:
         Path to generated Contents.json
     """
+    generated = generated or {}
+    written = {os.path.basename(path) for paths in generated.values() for path in paths}
+
     images = []
 
-    # Build image entries for each suffix (light/dark mode)
-    for suffix in suffixes:
-        appearance = {"appearances": [{"appearance": "luminosity", "value": "dark"}]} if suffix == "-dark" else {}
+    # Build image entries for each suffix (light/dark/tinted mode)
+    luminosity = {sfx: name for name, sfx in APPEARANCE_SUFFIXES.items() if sfx}
+    for suffix in list(suffixes) + [sfx for sfx in generated if sfx not in suffixes]:
+        if archive is not None and suffix not in generated:
+            continue
+
+        appearance = (
+            {"appearances": [{"appearance": "luminosity", "value": luminosity[suffix]}]}
+            if suffix in luminosity else {}
+        )
 
         for export_size, display_size, scale, filename in IOS_ICON_SIZES:
             # Add suffix to filename
-            if suffix:
-                name, ext = os.path.splitext(filename)
-                filename = f"{name}{suffix}{ext}"
+            filename = variant_filename(filename, suffix)
 
             # Check if file exists
-            filepath = os.path.join(output_dir, filename)
-            if not os.path.exists(filepath):
+            if suffix in generated:
+                if filename not in written:
+                    continue
+            elif not os.path.exists(os.path.join(output_dir, filename)):
                 continue
 
             # Build image entry
@@ -171,9 +1117,8 @@ def generate_contents_json(
                     "size": f"{display_size}x{display_size}",
                 }
 
-            # Add dark mode appearance if suffix is "-dark"
-            if suffix == "-dark":
-                entry.update(appearance)
+            # Add the dark/tinted appearance for suffixed variants
+            entry.update(appearance)
 
             images.append(entry)
 
@@ -186,57 +1131,142 @@ def generate_contents_json(
         }
     }
 
-    # Write Contents.json
-    output_path = os.path.join(output_dir, "Contents.json")
-    with open(output_path, "w") as f:
-        json.dump(contents, f, indent=2)
+    if archive is not None:
+        archive.add("Contents.json", json.dumps(contents, indent=2).encode())
+        print(f"📝 Added Contents.json with {len(images)} entries to {archive.target}")
+        return archive.member_name("Contents.json")
 
-    print(f"📝 Generated Contents.json with {len(images)} entries")
+    # Write Contents.json (left untouched if unchanged, so Xcode doesn't
+    # recompile the asset catalog)
+    output_path = os.path.join(output_dir, "Contents.json")
+    if write_text_if_changed(output_path, json.dumps(contents, indent=2)):
+        print(f"📝 Generated Contents.json with {len(images)} entries")
+    else:
+        print(f"📝 Contents.json unchanged ({len(images)} entries)")
     return output_path
 
 
-def validate_icons(output_dir: str) -> bool:
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# IHDR color type → mode name, for the validation report
+PNG_COLOR_TYPES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+
+
+def read_png_header(path: str, verify_crc: bool = False) -> Tuple[int, int, int, int, int]:
+    """
+    Read a PNG's dimensions and format from its signature and IHDR chunk.
+
+    Only the first 33 bytes are read unless verify_crc is set, in which case
+    the whole file is walked chunk by chunk and every CRC checked.
+
+    Args:
+        path: PNG file path
+        verify_crc: Also verify every chunk's CRC and that the file ends with IEND
+
+    Returns:
+        Tuple of (width, height, bit depth, color type, file size in bytes)
+
+    Raises:
+        ValueError: If the file is not a well-formed PNG
+    """
+    with open(path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        data = f.read() if verify_crc else f.read(33)
+
+    if data[:8] != PNG_SIGNATURE:
+        raise ValueError("not a PNG (bad signature)")
+    if len(data) < 33 or data[12:16] != b"IHDR" or struct.unpack(">I", data[8:12])[0] != 13:
+        raise ValueError("missing IHDR chunk")
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", data[16:26])
+    if color_type not in PNG_COLOR_TYPES:
+        raise ValueError(f"invalid color type {color_type}")
+
+    if verify_crc:
+        offset = 8
+        chunk_type = b""
+        while offset + 12 <= len(data):
+            length = struct.unpack(">I", data[offset:offset + 4])[0]
+            chunk_type = data[offset + 4:offset + 8]
+            end = offset + 8 + length
+            if end + 4 > len(data):
+                raise ValueError(f"truncated {chunk_type.decode('latin-1')} chunk")
+            crc = struct.unpack(">I", data[end:end + 4])[0]
+            if zlib.crc32(data[offset + 4:end]) != crc:
+                raise ValueError(f"bad CRC in {chunk_type.decode('latin-1')} chunk")
+            offset = end + 4
+            if chunk_type == b"IEND":
+                break
+        if chunk_type != b"IEND":
+            raise ValueError("missing IEND chunk (truncated file)")
+
+    return width, height, bit_depth, color_type, file_size
+
+
+def _check_icon(path: str, expected_size: int, verify_crc: bool) -> Tuple[bool, str]:
+    """Validate one icon file; returns (ok, report line)."""
+    filename = os.path.basename(path)
+    if not os.path.exists(path):
+        return False, f"  ❌ Missing: {filename}"
+    try:
+        width, height, bit_depth, color_type, file_size = read_png_header(path, verify_crc)
+    except (OSError, ValueError, struct.error) as e:
+        return False, f"  ❌ {filename}: Invalid PNG - {e}"
+
+    # Verify dimensions match expected
+    if width != expected_size or height != expected_size:
+        return False, f"  ❌ {filename}: Wrong size ({width}×{height}, expected {expected_size}×{expected_size})"
+    mode = f"{PNG_COLOR_TYPES[color_type]} {bit_depth}-bit"
+    return True, f"  ✓ {filename}: {width}×{height}, {mode}, {file_size / 1024:.1f} KB"
+
+
+def validate_icons(
+    output_dir: str,
+    suffixes: Optional[List[str]] = None,
+    verify_crc: bool = False,
+    jobs: int = 8,
+) -> bool:
     """
     Validate generated icons meet App Store requirements.
 
+    Reads only each PNG's signature and IHDR chunk (see read_png_header),
+    scanning files on a thread pool; the report stays in table order.
+
     Args:
         output_dir: Directory containing icon PNGs
+        suffixes: Filename suffixes to validate (default: the light set plus
+            every appearance with at least one variant present)
+        verify_crc: Also verify every chunk's CRC (reads whole files)
+        jobs: Number of threads scanning files
 
     Returns:
         True if all validations pass
     """
     print("\n🔍 Validating generated icons...")
 
-    all_valid = True
-    required_files = [f[3] for f in IOS_ICON_SIZES]
-
-    for filename in required_files:
-        filepath = os.path.join(output_dir, filename)
-
-        if not os.path.exists(filepath):
-            print(f"  ❌ Missing: {filename}")
-            all_valid = False
-            continue
-
-        # Check file is valid PNG
-        try:
-            img = Image.open(filepath)
-            width, height = img.size
+    if suffixes is None:
+        suffixes = [
+            suffix for suffix in APPEARANCE_SUFFIXES.values()
+            if not suffix or any(
+                os.path.exists(os.path.join(output_dir, variant_filename(f[3], suffix)))
+                for f in IOS_ICON_SIZES
+            )
+        ]
 
-            # Verify dimensions match expected
-            expected_size = next(f[0] for f in IOS_ICON_SIZES if f[3] == filename)
-            if width != expected_size or height != expected_size:
-                print(f"  ❌ {filename}: Wrong size ({width}×{height}, expected {expected_size}×{expected_size})")
-                all_valid = False
-            else:
-                print(f"  ✓ {filename}: {width}×{height}, {os.path.getsize(filepath) / 1024:.1f} KB")
+    checks = [
+        (os.path.join(output_dir, variant_filename(filename, suffix)), export_size)
+        for suffix in suffixes
+        for export_size, _, _, filename in IOS_ICON_SIZES
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = list(pool.map(lambda check: _check_icon(check[0], check[1], verify_crc), checks))
 
-        except Exception as e:
-            print(f"  ❌ {filename}: Invalid PNG - {e}")
-            all_valid = False
+    all_valid = True
+    for ok, line in results:
+        print(line)
+        all_valid = all_valid and ok
 
     if all_valid:
-        print("✅ All icons validated successfully")
+        print(f"✅ All {len(results)} icons validated successfully")
     else:
         print("❌ Some icons failed validation")
 
@@ -255,10 +1285,37 @@ Examples:
     # Generate dark mode icons
     python3 generate-icon-variants.py --input app-icon-dark.png --output AppIcon.appiconset/ --suffix -dark
 
+    # Resample small variants from a mipmap pyramid, reporting the deviation
+    python3 generate-icon-variants.py --input app-icon.png --resize-mode cascade --report-deviation
+
+    # Resize and encode on 4 threads
+    python3 generate-icon-variants.py --input app-icon.png --jobs 4
+
+    # Validate an existing icon set (all appearances), checking chunk CRCs
+    python3 generate-icon-variants.py --output AppIcon.appiconset/ --validate --verify-crc
+
+    # Stream a complete icon set into a zip, or as a tar to another machine
+    python3 generate-icon-variants.py --master light=app-icon.png --master dark=app-icon-dark.png --archive icons.zip
+    python3 generate-icon-variants.py --master light=app-icon.png --archive - | ssh builder 'tar -x -C /icons'
+
+    # Icon sets for a whole directory of white-label masters, unattended
+    python3 generate-icon-variants.py --batch masters/ --output build/icons/ --on-size-mismatch=crop
+
+    # Show which sizes are rendered once and shared between filenames
+    python3 generate-icon-variants.py --dry-run
+
     # Generate both light and dark mode, then update Contents.json
     python3 generate-icon-variants.py --input app-icon.png --output AppIcon.appiconset/
     python3 generate-icon-variants.py --input app-icon-dark.png --output AppIcon.appiconset/ --suffix -dark
     python3 generate-icon-variants.py --output AppIcon.appiconset/ --update-contents-json
+
+    # Same in one pass: every appearance and Contents.json
+    python3 generate-icon-variants.py --master light=app-icon.png --master dark=app-icon-dark.png \\
+        --output AppIcon.appiconset/ --jobs 4
+
+    # Light, dark and tinted (derived from light) in one pass
+    python3 generate-icon-variants.py --master light=app-icon.png --master dark=app-icon-dark.png \\
+        --derive-tinted --output AppIcon.appiconset/ --jobs 4
         """
     )
 
@@ -266,10 +1323,23 @@ Examples:
         "--input", "-i",
         help="Path to 1024×1024 master PNG file",
     )
+    parser.add_argument(
+        "--master", "-m",
+        action="append",
+        metavar="APPEARANCE=PATH",
+        help=f"Master PNG for an appearance ({', '.join(APPEARANCE_SUFFIXES)}); repeat to "
+             "generate all appearances and Contents.json in one pass",
+    )
+    parser.add_argument(
+        "--derive-tinted",
+        action="store_true",
+        help="With --master, derive the tinted appearance from the light master "
+             "(white on transparent) instead of requiring --master tinted=...",
+    )
     parser.add_argument(
         "--output", "-o",
-        default="LexiconFlow/LexiconFlow/Assets.xcassets/AppIcon.appiconset/",
-        help="Output directory for generated icons (default: AppIcon.appiconset/)",
+        help=f"Output directory for generated icons (default: AppIcon.appiconset/, "
+             f"or {BATCH_OUTPUT_DIR} with --batch)",
     )
     parser.add_argument(
         "--suffix", "-s",
@@ -282,6 +1352,59 @@ Examples:
         default=95,
         help="PNG quality 1-100 (default: 95)",
     )
+    parser.add_argument(
+        "--resize-mode",
+        choices=RESIZE_MODES,
+        default="direct",
+        help="direct: LANCZOS from the master for every size; cascade: from a "
+             "reduce() pyramid level at least twice the size (default: direct)",
+    )
+    parser.add_argument(
+        "--report-deviation",
+        action="store_true",
+        help="With --resize-mode cascade, report each variant's max pixel deviation from direct LANCZOS",
+    )
+    parser.add_argument(
+        "--hardlink",
+        action="store_true",
+        help="Hardlink filenames that share a pixel size instead of writing copies",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Resize, encode and validate variants on N threads (default: 1)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=f"Re-render every variant, even those {MANIFEST_FILENAME} records as up to date",
+    )
+    parser.add_argument(
+        "--on-size-mismatch",
+        choices=SIZE_MISMATCH_POLICIES,
+        default="prompt",
+        help="If a master isn't 1024×1024: prompt (interactive terminals only, "
+             "fails otherwise), fail, fit (resample), crop (center square) or "
+             "pad (corner color) (default: prompt)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Generate NAME.appiconset under --output for every NAME.png "
+             "(plus NAME-dark.png / NAME-tinted.png) in DIR, never prompting",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="PATH",
+        help="Stream variants and Contents.json into PATH (.zip, stored; or .tar) "
+             "or '-' for a tar on stdout, instead of writing files",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the render plan (unique sizes and the filenames sharing them) and exit",
+    )
     parser.add_argument(
         "--update-contents-json",
         action="store_true",
@@ -290,10 +1413,120 @@ Examples:
     parser.add_argument(
         "--validate",
         action="store_true",
-        help="Validate generated icons after creation",
+        help="Validate generated icons after creation (or on their own, without --input)",
+    )
+    parser.add_argument(
+        "--verify-crc",
+        action="store_true",
+        help="With --validate, also verify every PNG chunk's CRC (reads whole files)",
     )
 
     args = parser.parse_args()
+    if args.output is None:
+        args.output = BATCH_OUTPUT_DIR if args.batch else DEFAULT_OUTPUT_DIR
+
+    masters = {}
+    for spec in args.master or []:
+        name, sep, path = spec.partition("=")
+        if not sep or not path or name not in APPEARANCE_SUFFIXES:
+            print(f"❌ Error: Invalid --master {spec!r}; expected APPEARANCE=PATH "
+                  f"with APPEARANCE one of {', '.join(APPEARANCE_SUFFIXES)}")
+            sys.exit(1)
+        masters[name] = path
+
+    # Dry-run mode
+    if args.dry_run:
+        for suffix in [APPEARANCE_SUFFIXES[name] for name in masters] or [args.suffix]:
+            print_render_plan(build_render_plan(suffix))
+        return
+
+    # Batch mode: one icon set per master (group) in a directory
+    if args.batch:
+        if not os.path.isdir(args.batch):
+            print(f"❌ Error: Batch directory not found: {args.batch}")
+            sys.exit(1)
+        results = generate_batch(
+            args.batch,
+            args.output,
+            on_size_mismatch=args.on_size_mismatch,
+            derive_tinted=args.derive_tinted,
+            force=args.force,
+            quality=args.quality,
+            resize_mode=args.resize_mode,
+            report_deviation=args.report_deviation,
+            hardlink=args.hardlink,
+            jobs=args.jobs,
+        )
+        failed = {name: error for name, error in results.items() if error}
+        print(f"\n📊 Batch: {len(results) - len(failed)} of {len(results)} icon sets generated")
+        for name, error in failed.items():
+            print(f"  ❌ {name}: {error}")
+        if failed or not results:
+            sys.exit(1)
+        return
+
+    if args.archive and args.validate:
+        print("❌ Error: --validate checks files on disk and can't be combined with --archive")
+        sys.exit(1)
+
+    # Archive mode: stream variants and Contents.json, touching no files
+    if args.archive:
+        if not masters and not args.input:
+            print("❌ Error: --archive needs --input or --master")
+            sys.exit(1)
+        if not masters:
+            name = next((name for name, sfx in APPEARANCE_SUFFIXES.items() if sfx == args.suffix), None)
+            if name is None:
+                print(f"❌ Error: --archive with --suffix {args.suffix!r} has no Contents.json appearance; use --master")
+                sys.exit(1)
+            masters = {name: args.input}
+        try:
+            archive = ArchiveWriter(args.archive, prefix=os.path.basename(os.path.normpath(args.output)))
+            # The tar stream owns stdout; progress goes to stderr
+            with archive, contextlib.redirect_stdout(sys.stderr if args.archive == "-" else sys.stdout):
+                generated = generate_appearances(
+                    masters,
+                    args.output,
+                    derive_tinted=args.derive_tinted,
+                    on_size_mismatch=args.on_size_mismatch,
+                    quality=args.quality,
+                    resize_mode=args.resize_mode,
+                    report_deviation=args.report_deviation,
+                    hardlink=args.hardlink,
+                    jobs=args.jobs,
+                    archive=archive,
+                )
+                generate_contents_json(args.output, generated=generated, archive=archive)
+        except Exception as e:
+            print(f"\n❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    # One-shot mode: every appearance, then Contents.json from what was written
+    if masters:
+        try:
+            generated = generate_appearances(
+                masters,
+                args.output,
+                derive_tinted=args.derive_tinted,
+                force=args.force,
+                on_size_mismatch=args.on_size_mismatch,
+                quality=args.quality,
+                resize_mode=args.resize_mode,
+                report_deviation=args.report_deviation,
+                hardlink=args.hardlink,
+                jobs=args.jobs,
+            )
+            generate_contents_json(args.output, generated=generated)
+
+            if args.validate:
+                validate_icons(args.output, verify_crc=args.verify_crc, jobs=args.jobs)
+
+            print("\n🚀 Ready to import into Xcode!")
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
+        return
 
     # Update Contents.json mode
     if args.update_contents_json:
@@ -305,24 +1538,36 @@ Examples:
         print("\n🚀 Ready to import into Xcode!")
         return
 
+    # Validate-only mode
+    if args.validate and not args.input:
+        if not validate_icons(args.output, verify_crc=args.verify_crc, jobs=args.jobs):
+            sys.exit(1)
+        return
+
     # Generate variants mode
     if not args.input:
         parser.print_help()
-        print("\n❌ Error: --input is required (unless using --update-contents-json)")
+        print("\n❌ Error: --input or --master is required (unless using --update-contents-json)")
         sys.exit(1)
 
     try:
         # Generate variants
         generate_variants(
-            input_path=args.input,
+            master=args.input,
             output_dir=args.output,
             suffix=args.suffix,
             quality=args.quality,
+            resize_mode=args.resize_mode,
+            report_deviation=args.report_deviation,
+            hardlink=args.hardlink,
+            jobs=args.jobs,
+            force=args.force,
+            on_size_mismatch=args.on_size_mismatch,
         )
 
         # Validate if requested
         if args.validate:
-            validate_icons(args.output)
+            validate_icons(args.output, verify_crc=args.verify_crc, jobs=args.jobs)
 
         print("\n🎉 Icon generation complete!")
         print(f"📂 Icons saved to: {args.output}")
@@ -3,19 +3,26 @@
 process_screenshots.py
 
 Process raw screenshots for App Store submission.
-Adds captions, device frames, and optimization.
+Fits captures to the device's export size, adds captions, device frames,
+and optimization.
 
 Usage:
     python3 process_screenshots.py --device iphone_15 --input raw/ --output processed/
 """
 
 import argparse
+import functools
+import io
 import os
+import shutil
+import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageColor, ImageDraw, ImageFont
 except ImportError:
     print("❌ Error: Pillow is required.")
     print("Install with: pip3 install Pillow")
@@ -60,32 +67,221 @@ CAPTIONS = {
     6: "Start learning vocabulary today",
 }
 
+# Output filename titles for each screenshot
+SCREENSHOT_TITLES = {
+    1: "FORGET_LESS",
+    2: "FSRS_V5",
+    3: "LIQUID_GLASS",
+    4: "STUDY_MODES",
+    5: "SMART_SCHEDULING",
+    6: "START_LEARNING",
+}
+
+
+# How captures whose size differs from the device's export_size are fitted:
+# scale stretches to the exact size, letterbox fits inside and pads with a
+# background color, crop fills the frame and trims the overflow (centered)
+FIT_POLICIES = ["scale", "letterbox", "crop"]
+
+# Resampling first box-reduces by an integer factor until within this factor
+# of the target (see Image.resize reducing_gap); exact multiples only reduce
+REDUCING_GAP = 3.0
+
+
+def _resample(img, size, box=None):
+    """Resize (a box of) img to size; exact integer downscales only reduce()."""
+    box = box or (0, 0) + img.size
+    factor = (box[2] - box[0]) / size[0]
+    if factor == (box[3] - box[1]) / size[1] and factor.is_integer() and all(float(v).is_integer() for v in box):
+        box = tuple(int(v) for v in box)
+        return img.reduce(int(factor), box=box) if factor > 1 else img.crop(box)
+    return img.resize(size, Image.Resampling.LANCZOS, box=box, reducing_gap=REDUCING_GAP)
+
+
+def fit_to_export(img, export_size, fit="letterbox", background=(0, 0, 0)):
+    """
+    Bring a capture to a device's export size.
+
+    Args:
+        img: PIL Image (a lazily opened JPEG is drafted at reduced scale)
+        export_size: Target (width, height)
+        fit: One of FIT_POLICIES
+        background: RGB letterbox color
+
+    Returns:
+        PIL Image of exactly export_size (img itself if already that size)
+    """
+    if img.size == tuple(export_size):
+        return img
+
+    width, height = export_size
+    src_width, src_height = img.size
+
+    if fit == "scale":
+        inner = (width, height)
+    else:
+        ratio = (min if fit == "letterbox" else max)(width / src_width, height / src_height)
+        inner = (max(1, round(src_width * ratio)), max(1, round(src_height * ratio)))
+
+    # JPEG captures decode straight at 1/2, 1/4 or 1/8 scale (no-op for PNG)
+    if img.format == "JPEG":
+        img.draft("RGB", inner)
+        src_width, src_height = img.size
+
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    if fit == "crop":
+        # Resample only the centered source region that ends up in the frame
+        box_width, box_height = min(src_width, width * src_width / inner[0]), min(src_height, height * src_height / inner[1])
+        left, top = (src_width - box_width) / 2, (src_height - box_height) / 2
+        return _resample(img, (width, height), (left, top, left + box_width, top + box_height))
+
+    resized = _resample(img, inner)
+    if resized.size == (width, height):
+        return resized
+
+    canvas = Image.new("RGB", (width, height), background)
+    canvas.paste(resized, ((width - inner[0]) // 2, (height - inner[1]) // 2))
+    return canvas
+
+
+# Caption fonts, best first: (path, face index in a .ttc). Helvetica on macOS,
+# then its metric-compatible clones so Linux builders lay captions out the same
+CAPTION_FONTS = [
+    ("/System/Library/Fonts/Helvetica.ttc", 0),
+    ("/usr/share/fonts/opentype/urw-base35/NimbusSans-Regular.otf", 0),
+    ("/usr/share/fonts/urw-base35/NimbusSans-Regular.otf", 0),
+    ("/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf", 0),
+    ("/usr/share/fonts/liberation-sans/LiberationSans-Regular.ttf", 0),
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 0),
+    ("/usr/share/fonts/dejavu/DejaVuSans.ttf", 0),
+]
+
+# Family asked of fontconfig (fc-match) when none of the above exist
+CAPTION_FONT_FAMILY = "Helvetica"
+
+# Extra fonts, as PATH or PATH#INDEX separated by os.pathsep, searched first
+FONT_PATH_ENV = "SCREENSHOT_FONTS"
+
+
+def parse_font_spec(spec):
+    """Split "PATH" or "PATH#INDEX" into (path, index)."""
+    path, sep, index = spec.rpartition("#")
+    if sep and index.isdigit():
+        return path, int(index)
+    return spec, 0
+
+
+@functools.lru_cache(maxsize=None)
+def _fontconfig_match(family):
+    """Ask fontconfig for the file it would use for a family, or None."""
+    if not shutil.which("fc-match"):
+        return None
+    try:
+        result = subprocess.run(
+            ["fc-match", "--format=%{file}#%{index}", family],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return parse_font_spec(result.stdout.strip()) if result.returncode == 0 and result.stdout else None
+
+
+def font_candidates(extra_fonts=()):
+    """
+    Fonts to try for captions, in order.
+
+    Args:
+        extra_fonts: (path, index) pairs to try first (e.g. from --font)
+
+    Returns:
+        List of (path, index): extra_fonts, $SCREENSHOT_FONTS, CAPTION_FONTS,
+        then fontconfig's match for CAPTION_FONT_FAMILY
+    """
+    candidates = list(extra_fonts)
+    candidates += [parse_font_spec(spec) for spec in os.environ.get(FONT_PATH_ENV, "").split(os.pathsep) if spec]
+    candidates += CAPTION_FONTS
+    match = _fontconfig_match(CAPTION_FONT_FAMILY)
+    if match:
+        candidates.append(match)
+    return candidates
+
+
+@functools.lru_cache(maxsize=None)
+def load_font(path, size, index=0):
+    """
+    Load a FreeType font, memoized per (path, size, index).
+
+    Parsing a multi-MB .ttc costs more than drawing a caption, so every
+    screenshot at the same size shares one FreeTypeFont.
+
+    Raises:
+        OSError: If the file is missing or not a font
+    """
+    return ImageFont.truetype(path, size, index=index)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_font(size, extra_fonts=()):
+    """
+    First loadable caption font at a size.
+
+    Falls back to Pillow's bundled scalable font (Pillow 10.1+), and only
+    then to the fixed-size bitmap default.
 
-def add_caption(img, text, device_name):
+    Args:
+        size: Font size in pixels
+        extra_fonts: Tuple of (path, index) pairs to try first
+
+    Returns:
+        Tuple (font, description of where it came from)
+    """
+    for path, index in font_candidates(extra_fonts):
+        if not os.path.exists(path):
+            continue
+        try:
+            return load_font(path, size, index), f"{path}#{index}" if index else path
+        except OSError:
+            continue
+
+    try:
+        return ImageFont.load_default(size), "Pillow bundled font"
+    except TypeError:  # Pillow < 10.1: no sizes, bitmap only
+        return ImageFont.load_default(), "Pillow bitmap font (install a TrueType font)"
+
+
+def add_caption(img, text, device_name, fonts=()):
     """
     Add caption overlay to screenshot.
 
+    RGB images are captioned in place; other modes are converted to RGB first.
+
     Args:
         img: PIL Image
         text: Caption text
         device_name: Device name for font sizing
+        fonts: Extra (path, index) fonts to try first (see resolve_font)
 
     Returns:
         PIL Image with caption
     """
     width, height = img.size
-
-    # Create overlay
-    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
 
     # Caption positioning
     caption_height = int(height * 0.25)
     caption_y = height - caption_height
 
+    # Only the caption band is composited; the top 75% is never copied
+    band = img.crop((0, caption_y, width, height)).convert('RGBA')
+    overlay = Image.new('RGBA', band.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+
     # Semi-transparent background
     draw.rectangle(
-        [(0, caption_y), (width, height)],
+        [(0, 0), band.size],
         fill=(0, 0, 0, 153)  # Black with 60% opacity
     )
 
@@ -95,34 +291,112 @@ def add_caption(img, text, device_name):
     else:
         font_size = 40
 
-    # Load font
-    try:
-        # Try system font first
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-    except:
-        # Fall back to default
-        font = ImageFont.load_default()
+    # Load font (memoized)
+    font, _ = resolve_font(font_size, tuple(fonts))
 
-    # Calculate text position (centered)
+    # Calculate text position (centered, band coordinates)
     bbox = draw.textbbox((0, 0), text, font=font)
     text_width = bbox[2] - bbox[0]
     text_x = (width - text_width) // 2
-    text_y = caption_y + int(caption_height * 0.3)
+    text_y = int(caption_height * 0.3)
 
     # Draw text
     draw.text((text_x, text_y), text, fill=(255, 255, 255, 255), font=font)
 
-    # Composite caption onto image
-    result = Image.alpha_composite(img.convert('RGBA'), overlay)
+    # Composite caption onto the band and paste it back
+    img.paste(Image.alpha_composite(band, overlay).convert('RGB'), (0, caption_y))
+
+    return img
 
-    return result.convert('RGB')
+
+# PNG encoder settings per --compression mode. fast is for local iteration,
+# max (Pillow's exhaustive optimize) for release builds; balanced picks
+# per image from BALANCED_LEVELS (see choose_png_settings)
+COMPRESSION_MODES = {
+    "fast": {"compress_level": 1},
+    "balanced": None,
+    "max": {"optimize": True},
+}
+
+# zlib levels balanced chooses between: 6 shrinks flat UI several-fold over
+# 1, but on noisy or photographic frames it is slower and often larger
+BALANCED_LEVELS = (1, 6)
+
+# balanced encodes this many evenly spaced strips of STRIP_ROWS rows to choose
+BALANCED_STRIPS = 8
+BALANCED_STRIP_ROWS = 24
+
+
+def choose_png_settings(img):
+    """
+    Pick the zlib level for an image by trial-encoding a sample of it.
+
+    Pillow filters PNG rows adaptively on its own, so the per-image choice
+    left is how hard zlib should work on the filtered rows.
+
+    Args:
+        img: PIL Image
+
+    Returns:
+        Dict of PNG save options
+    """
+    width, height = img.size
+    strip_rows = min(BALANCED_STRIP_ROWS, height)
+    strips = min(BALANCED_STRIPS, height // strip_rows)
+    sample = Image.new(img.mode, (width, strips * strip_rows))
+    for i in range(strips):
+        top = (height - strip_rows) * i // max(1, strips - 1)
+        sample.paste(img.crop((0, top, width, top + strip_rows)), (0, i * strip_rows))
+
+    def sample_size(level):
+        buffer = io.BytesIO()
+        sample.save(buffer, 'PNG', compress_level=level)
+        return buffer.tell()
+
+    return {"compress_level": min(BALANCED_LEVELS, key=sample_size)}
+
+
+def save_png(img, output_path, compression="max"):
+    """
+    Save an image as PNG with a COMPRESSION_MODES mode.
+
+    Args:
+        img: PIL Image
+        output_path: Path to write
+        compression: Key of COMPRESSION_MODES
+
+    Returns:
+        Dict with output_path, bytes, encode_seconds and settings (the PNG
+        save options used)
+    """
+    start = time.perf_counter()
+    settings = COMPRESSION_MODES[compression] or choose_png_settings(img)
+    img.save(output_path, 'PNG', **settings)
+    return {
+        "output_path": output_path,
+        "bytes": os.path.getsize(output_path),
+        "encode_seconds": time.perf_counter() - start,
+        "settings": settings,
+    }
+
+
+def format_png_settings(settings):
+    """Describe PNG save options for logs, e.g. ", level 6"."""
+    if settings.get("optimize"):
+        return ", optimize"
+    return f", level {settings['compress_level']}"
 
 
 def process_screenshot(
     input_path,
     output_path,
     caption_text=None,
-    device_name="iPhone"
+    device_name="iPhone",
+    fonts=(),
+    export_size=None,
+    fit="letterbox",
+    background=(0, 0, 0),
+    compression="max"
 ):
     """
     Process a single screenshot.
@@ -132,17 +406,172 @@ def process_screenshot(
         output_path: Path to save processed screenshot
         caption_text: Optional caption text
         device_name: Device name for font sizing
+        fonts: Extra (path, index) caption fonts to try first
+        export_size: Optional (width, height) to fit the capture to
+        fit: One of FIT_POLICIES
+        background: RGB letterbox color
+        compression: PNG compression mode (key of COMPRESSION_MODES)
+
+    Returns:
+        Encode stats dict (see save_png)
     """
     # Load image
     img = Image.open(input_path)
 
+    # Fit to export size before captioning, so captions land on the final frame
+    if export_size:
+        img = fit_to_export(img, export_size, fit, background)
+
     # Add caption if provided
     if caption_text:
-        img = add_caption(img, caption_text, device_name)
+        img = add_caption(img, caption_text, device_name, fonts)
 
     # Save
-    img.save(output_path, 'PNG', optimize=True)
-    print(f"  ✓ Processed: {os.path.basename(output_path)}")
+    return save_png(img, output_path, compression)
+
+
+# Raw capture file extensions, in order of preference
+CAPTURE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def find_screenshot(input_dir, index):
+    """
+    Find raw screenshot number `index` in a directory.
+
+    Returns:
+        Path to the first of {i}, {i}_raw, screenshot_{i} that exists with
+        one of CAPTURE_EXTENSIONS (PNG preferred), or None
+    """
+    for name in (f"{index}", f"{index}_raw", f"screenshot_{index}"):
+        for extension in CAPTURE_EXTENSIONS:
+            test_path = os.path.join(input_dir, name + extension)
+            if os.path.exists(test_path):
+                return test_path
+    return None
+
+
+def _process_item(item):
+    """
+    Process one (device, screenshot) work item; runs in a worker process.
+
+    Failures are returned rather than raised, so one bad screenshot doesn't
+    abort the rest of the batch.
+
+    Args:
+        item: Tuple (device_type, index, input_path, output_path, caption_text,
+            options), options being extra process_screenshot keyword arguments
+
+    Returns:
+        Tuple (device_type, index, output_path, error message or None, seconds,
+        raw capture size if it was fitted to the export size else None,
+        encode stats from save_png or None)
+    """
+    device_type, index, input_path, output_path, caption_text, options = item
+    spec = DEVICE_SPECS[device_type]
+    start = time.perf_counter()
+    fitted_from = encode = None
+    try:
+        with Image.open(input_path) as raw:
+            if raw.size != spec["export_size"]:
+                fitted_from = raw.size
+        encode = process_screenshot(
+            input_path, output_path, caption_text, spec["name"],
+            export_size=spec["export_size"], **options
+        )
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return device_type, index, output_path, error, time.perf_counter() - start, fitted_from, encode
+
+
+def process_devices(
+    targets,
+    add_captions=True,
+    add_frames=False,
+    jobs=1,
+    **options
+):
+    """
+    Process screenshots for several devices, spreading the work over processes.
+
+    Every (device, screenshot) pair is a separate work item, so all devices
+    share one pool.
+
+    Captures are fitted to each device's export_size (see fit_to_export).
+
+    Args:
+        targets: List of (device_type, input_dir, output_dir)
+        add_captions: Whether to add caption overlays
+        add_frames: Whether to add device frames (not implemented)
+        jobs: Number of worker processes (1 processes in-process)
+        **options: Passed to process_screenshot (fonts, fit, background,
+            compression)
+
+    Returns:
+        Dict with "processed", "failed" and "missing" lists of
+        (device_type, index, path or message), plus the total "bytes" written
+        and "encode_seconds" spent in the PNG encoder
+    """
+    items = []
+    summary = {"processed": [], "failed": [], "missing": [], "bytes": 0, "encode_seconds": 0.0}
+    for device_type, input_dir, output_dir in targets:
+        width, height = DEVICE_SPECS[device_type]["export_size"]
+
+        # Create output directory
+        os.makedirs(output_dir, exist_ok=True)
+
+        for i in range(1, 7):
+            input_path = find_screenshot(input_dir, i)
+            if not input_path:
+                summary["missing"].append((device_type, i, input_dir))
+                continue
+
+            output_filename = f"{i}_{SCREENSHOT_TITLES[i]}_{width}x{height}.png"
+            items.append((
+                device_type,
+                i,
+                input_path,
+                os.path.join(output_dir, output_filename),
+                CAPTIONS[i] if add_captions else None,
+                options,
+            ))
+
+    if jobs <= 1 or len(items) <= 1:
+        results = [_process_item(item) for item in items]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+            futures = [pool.submit(_process_item, item) for item in items]
+            results = []
+            for item, future in zip(items, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:  # Worker died (e.g. out of memory)
+                    results.append((item[0], item[1], item[3], f"{type(e).__name__}: {e}", 0.0, None, None))
+
+    # Report in (device, screenshot) order, whatever order workers finished in
+    missing = {(device_type, i) for device_type, i, _ in summary["missing"]}
+    by_item = {(device_type, index): result for device_type, index, *result in results}
+    for device_type, input_dir, _ in targets:
+        if len(targets) > 1:
+            print(f"\n📱 {DEVICE_SPECS[device_type]['name']}:")
+        for i in range(1, 7):
+            if (device_type, i) in missing:
+                print(f"⚠️  Warning: Screenshot {i} not found in {input_dir}")
+                continue
+            output_path, error, seconds, fitted_from, encode = by_item[(device_type, i)]
+            if error:
+                print(f"  ❌ Failed: screenshot {i} ({error})")
+                summary["failed"].append((device_type, i, error))
+            else:
+                fitted = f", fitted from {fitted_from[0]}x{fitted_from[1]}" if fitted_from else ""
+                print(f"  ✓ Processed: {os.path.basename(output_path)} ({seconds:.2f}s, "
+                      f"encode {encode['encode_seconds']:.2f}s, {encode['bytes'] / 1024:.0f} KB"
+                      f"{format_png_settings(encode['settings'])}{fitted})")
+                summary["processed"].append((device_type, i, output_path))
+                summary["bytes"] += encode["bytes"]
+                summary["encode_seconds"] += encode["encode_seconds"]
+
+    return summary
 
 
 def batch_process(
@@ -150,7 +579,9 @@ def batch_process(
     output_dir,
     device_type,
     add_captions=True,
-    add_frames=False
+    add_frames=False,
+    jobs=1,
+    **options
 ):
     """
     Process all screenshots in a directory.
@@ -161,6 +592,12 @@ def batch_process(
         device_type: Device type (iphone_se, iphone_15, etc.)
         add_captions: Whether to add caption overlays
         add_frames: Whether to add device frames (not implemented)
+        jobs: Number of worker processes
+        **options: Passed to process_screenshot (fonts, fit, background,
+            compression)
+
+    Returns:
+        Summary dict (see process_devices)
     """
     # Get device specs
     if device_type not in DEVICE_SPECS:
@@ -168,59 +605,10 @@ def batch_process(
         print(f"Valid types: {', '.join(DEVICE_SPECS.keys())}")
         sys.exit(1)
 
-    specs = DEVICE_SPECS[device_type]
-    device_name = specs["name"]
-    export_size = specs["export_size"]
-
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Process each screenshot (1-6)
-    for i in range(1, 7):
-        # Input filename pattern
-        input_files = [
-            f"{i}.png",
-            f"{i}_raw.png",
-            f"screenshot_{i}.png",
-        ]
-
-        input_path = None
-        for filename in input_files:
-            test_path = os.path.join(input_dir, filename)
-            if os.path.exists(test_path):
-                input_path = test_path
-                break
-
-        if not input_path:
-            print(f"⚠️  Warning: Screenshot {i} not found in {input_dir}")
-            continue
-
-        # Output filename
-        title = {
-            1: "FORGET_LESS",
-            2: "FSRS_V5",
-            3: "LIQUID_GLASS",
-            4: "STUDY_MODES",
-            5: "SMART_SCHEDULING",
-            6: "START_LEARNING",
-        }[i]
-
-        width, height = export_size
-        output_filename = f"{i}_{title}_{width}x{height}.png"
-        output_path = os.path.join(output_dir, output_filename)
-
-        # Caption text
-        caption_text = CAPTIONS[i] if add_captions else None
-
-        # Process
-        process_screenshot(
-            input_path,
-            output_path,
-            caption_text,
-            device_name
-        )
+    summary = process_devices([(device_type, input_dir, output_dir)], add_captions, add_frames, jobs, **options)
 
     print(f"\n✅ Processed screenshots in {output_dir}")
+    return summary
 
 
 def main():
@@ -235,16 +623,28 @@ Examples:
     # Process iPad screenshots without captions
     python3 process_screenshots.py --device ipad --input raw/ --output processed/ --no-captions
 
+    # Use a specific caption font (face 1 of a collection)
+    python3 process_screenshots.py --device iphone_15 --font /path/to/Brand.ttc#1
+
+    # Crop mismatched captures to fill the frame instead of letterboxing
+    python3 process_screenshots.py --device ipad --fit crop
+
+    # Quick local iteration: fast PNG encoding (bigger files)
+    python3 process_screenshots.py --device all --compression fast
+
+    # Every device in one run, on 8 worker processes
+    python3 process_screenshots.py --device all --input raw/ --output processed/ --jobs 8
+
 Device types:
-    iphone_se, iphone_15, iphone_15_pro_max, ipad
+    iphone_se, iphone_15, iphone_15_pro_max, ipad, all
         """
     )
 
     parser.add_argument(
         "--device", "-d",
         required=True,
-        choices=list(DEVICE_SPECS.keys()),
-        help="Device type"
+        choices=list(DEVICE_SPECS.keys()) + ["all"],
+        help="Device type, or 'all' for every device"
     )
     parser.add_argument(
         "--input", "-i",
@@ -266,27 +666,96 @@ Device types:
         action="store_true",
         help="Add device frames (not yet implemented)"
     )
+    parser.add_argument(
+        "--font",
+        action="append",
+        default=[],
+        metavar="PATH[#INDEX]",
+        help=f"Caption font to try first (repeatable); also ${FONT_PATH_ENV}",
+    )
+    parser.add_argument(
+        "--fit",
+        choices=FIT_POLICIES,
+        default="letterbox",
+        help="How to fit captures that aren't the device's export size: "
+             "scale (stretch), letterbox (pad with --background) or crop "
+             "(default: letterbox)"
+    )
+    parser.add_argument(
+        "--background",
+        default="#000000",
+        help="Letterbox color, any CSS color (default: #000000)"
+    )
+    parser.add_argument(
+        "--compression",
+        choices=list(COMPRESSION_MODES),
+        default="max",
+        help="PNG compression: fast (zlib level 1, local iteration), balanced "
+             "(zlib level chosen per image) or max (exhaustive optimize, "
+             "release builds; default)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Process screenshots in N worker processes (default: 1)"
+    )
 
     args = parser.parse_args()
 
-    # Build paths
-    input_dir = os.path.join(args.input, args.device)
-    output_dir = os.path.join(args.output, args.device)
+    devices = list(DEVICE_SPECS) if args.device == "all" else [args.device]
 
-    print(f"📱 Processing {args.device} screenshots...")
-    print(f"   Input:  {input_dir}")
-    print(f"   Output: {output_dir}")
+    try:
+        background = ImageColor.getrgb(args.background)[:3]
+    except ValueError as e:
+        print(f"❌ Error: --background: {e}")
+        sys.exit(1)
+
+    # Build paths
+    targets = [
+        (device, os.path.join(args.input, device), os.path.join(args.output, device))
+        for device in devices
+    ]
+
+    print(f"📱 Processing {', '.join(devices)} screenshots...")
+    print(f"   Input:  {args.input if len(devices) > 1 else targets[0][1]}")
+    print(f"   Output: {args.output if len(devices) > 1 else targets[0][2]}")
+    fonts = tuple(parse_font_spec(spec) for spec in args.font)
     print(f"   Captions: {'Yes' if not args.no_captions else 'No'}")
+    if not args.no_captions:
+        print(f"   Font: {resolve_font(40, fonts)[1]}")
+    print(f"   Fit: {args.fit}" + (f" ({args.background})" if args.fit == "letterbox" else ""))
+    print(f"   Compression: {args.compression}")
+    print(f"   Jobs: {args.jobs}")
     print()
 
     # Process
-    batch_process(
-        input_dir=input_dir,
-        output_dir=output_dir,
-        device_type=args.device,
+    start = time.perf_counter()
+    summary = process_devices(
+        targets,
         add_captions=not args.no_captions,
-        add_frames=args.add_frames
+        add_frames=args.add_frames,
+        jobs=args.jobs,
+        fonts=fonts,
+        fit=args.fit,
+        background=background,
+        compression=args.compression
     )
+    wall_time = time.perf_counter() - start
+
+    print(f"\n📊 Summary ({wall_time:.2f}s):")
+    for device, _, output_dir in targets:
+        done = sum(1 for d, _, _ in summary["processed"] if d == device)
+        print(f"  {device:<18} {done}/6 processed → {output_dir}")
+    print(f"  {len(summary['processed'])} processed, {len(summary['failed'])} failed, "
+          f"{len(summary['missing'])} missing")
+    print(f"  {summary['bytes'] / 1024 / 1024:.1f} MB written, "
+          f"{summary['encode_seconds']:.2f}s encoding ({args.compression})")
+    for device, index, error in summary["failed"]:
+        print(f"  ❌ {device} screenshot {index}: {error}")
+
+    if summary["failed"]:
+        sys.exit(1)
 
     print("\n🎉 Screenshot processing complete!")
 